@@ -1,5 +1,6 @@
 """Config file for model parameters"""
 
+from dataclasses import dataclass
 from pathlib import Path
 
 # PATH NAMES
@@ -158,3 +159,44 @@ UNDERSCORE_NUMBER_REGEX = r"\_\d+"
 NUMBER_REGEX = r"\d+"
 
 MAX_TASKS_PER_MP_CHILD = 4
+
+
+@dataclass(frozen=True)
+class ModelConfig:
+    """Read-only bundle of the scalar model parameters.
+
+    Hot loops can bind the MODEL_CONFIG instance once and read the scalars
+    via attribute access instead of repeated module-level lookups. The
+    module-level constants above remain the canonical definitions.
+    """
+
+    model_year_start: int = MODEL_YEAR_START
+    model_year_end: int = MODEL_YEAR_END
+    discount_rate: float = DISCOUNT_RATE
+    usd_to_eur_conversion_default: float = USD_TO_EUR_CONVERSION_DEFAULT
+    steel_plant_lifetime_years: int = STEEL_PLANT_LIFETIME_YEARS
+    investment_cycle_duration_years: int = INVESTMENT_CYCLE_DURATION_YEARS
+    investment_cycle_variance_years: int = INVESTMENT_CYCLE_VARIANCE_YEARS
+    investment_offcycle_buffer_top: int = INVESTMENT_OFFCYCLE_BUFFER_TOP
+    investment_offcycle_buffer_tail: int = INVESTMENT_OFFCYCLE_BUFFER_TAIL
+    net_zero_variance_years: int = NET_ZERO_VARIANCE_YEARS
+    capacity_utilization_cutoff_for_new_plant_decision: float = (
+        CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION
+    )
+    capacity_utilization_cutoff_for_closing_plant_decision: float = (
+        CAPACITY_UTILIZATION_CUTOFF_FOR_CLOSING_PLANT_DECISION
+    )
+    scrap_constraint_tolerance_factor: float = SCRAP_CONSTRAINT_TOLERANCE_FACTOR
+    capacity_constraint_fixed_rate_mtpa: float = CAPACITY_CONSTRAINT_FIXED_RATE_MTPA
+    capacity_constraint_fixed_growth_rate: float = (
+        CAPACITY_CONSTRAINT_FIXED_GROWTH_RATE
+    )
+    tco_rank_2_scaler: float = TCO_RANK_2_SCALER
+    tco_rank_1_scaler: float = TCO_RANK_1_SCALER
+    abatement_rank_2: float = ABATEMENT_RANK_2
+    abatement_rank_3: float = ABATEMENT_RANK_3
+    average_capacity_mt: float = AVERAGE_CAPACITY_MT
+    average_cuf: float = AVERAGE_CUF
+
+
+MODEL_CONFIG = ModelConfig()
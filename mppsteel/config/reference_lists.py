@@ -196,6 +196,24 @@ SWITCH_DICT: MYPY_DICT_STR_LIST = {
 
 TECH_REFERENCE_LIST = list(SWITCH_DICT.keys())
 
+
+def _reverse_mapper(mapper: MYPY_DICT_STR_LIST) -> dict:
+    """Inverts a {key: [values]} mapping to {value: frozenset(keys)}."""
+    reversed_mapper: dict = {}
+    for key, value_list in mapper.items():
+        for value in value_list:
+            reversed_mapper.setdefault(value, set()).add(key)
+    return {value: frozenset(keys) for value, keys in reversed_mapper.items()}
+
+
+# Reverse mappings, built once at import so lookups are O(1) hash probes
+# instead of linear scans over the forward dictionaries.
+TECH_TO_FURNACE_GROUPS = _reverse_mapper(FURNACE_GROUP_DICT)
+TECH_INCOMING_SWITCHES = _reverse_mapper(SWITCH_DICT)
+CATEGORY_TO_RESOURCES = _reverse_mapper(
+    {resource: [category] for resource, category in RESOURCE_CATEGORY_MAPPER.items()}
+)
+
 TECHNOLOGY_PHASES: MYPY_DICT_STR_LIST = {
     "initial": ["Avg BF-BOF"],
     "transitional": [
@@ -256,8 +274,9 @@ GRAPH_CAPEX_OPEX_DICT_SPLIT: MYPY_DICT_STR_LIST = {
     "Electricity": ["Electricity"],
     "CCS": ["CCS"],
     "Other OPEX": [
-        ["Other OPEX"],
-        ["Steam", "BF slag"],
+        "Other OPEX",
+        "Steam",
+        "BF slag",
     ],  # attention! BF slag is a co product that is sold of to other industry sectors and produces revenue (so its negative costs added to the OPEX sum which reduces the actual result of other OPEX)
     "BF Capex": ["BF Capex"],  # with WACC over 20 years
     "GF Capex": ["GF Capex"],  # with WACC over 20 years
@@ -286,35 +305,39 @@ GRAPH_COL_ORDER = [
     "EAF",
 ]
 
-# BUSINESS CASE UNITS
-GJ_RESOURCES = [
-    "BF gas",
-    "COG",
-    "BOF gas",
-    "Natural gas",
-    "Plastic waste",
-    "Biomass",
-    "Biomethane",
-    "Hydrogen",
-    "Electricity",
-    "Steam",
-    "Coke",
-    "Thermal coal",
-]
+# BUSINESS CASE UNITS (frozensets: consumed via membership tests only)
+GJ_RESOURCES = frozenset(
+    {
+        "BF gas",
+        "COG",
+        "BOF gas",
+        "Natural gas",
+        "Plastic waste",
+        "Biomass",
+        "Biomethane",
+        "Hydrogen",
+        "Electricity",
+        "Steam",
+        "Coke",
+        "Thermal coal",
+    }
+)
 
-KG_RESOURCES = ["BF slag", "Other slag"]
-
-TON_RESOURCES = [
-    "Iron ore",
-    "Scrap",
-    "DRI",
-    "Met coal",
-    "Process emissions",
-    "Emissivity wout CCS",
-    "Captured CO2",
-    "Used CO2",
-    "Emissivity",
-]
+KG_RESOURCES = frozenset({"BF slag", "Other slag"})
+
+TON_RESOURCES = frozenset(
+    {
+        "Iron ore",
+        "Scrap",
+        "DRI",
+        "Met coal",
+        "Process emissions",
+        "Emissivity wout CCS",
+        "Captured CO2",
+        "Used CO2",
+        "Emissivity",
+    }
+)
 
 WESTERN_EUROPE_COUNTRIES = [
     "ITA",
@@ -516,7 +539,7 @@ MULTI_RUN_MULTI_SCENARIO_SUMMARY_FILENAMES = [
 FORMATTED_PKL_FILES = ["capex_switching_df"]
 
 # OUTPUT FILE NAMES
-INTERMEDIATE_RESULT_PKL_FILES = [
+INTERMEDIATE_RESULT_PKL_FILES = (
     "plant_result_df",
     "calculated_emissivity_combined",
     "levelized_cost_standardized",
@@ -525,9 +548,9 @@ INTERMEDIATE_RESULT_PKL_FILES = [
     "full_trade_summary",
     "tech_choice_records",
     "tech_rank_records",
-]
+)
 
-FINAL_RESULT_PKL_FILES = [
+FINAL_RESULT_PKL_FILES = (
     "production_resource_usage",
     "production_emissions",
     "global_metaresults",
@@ -535,7 +558,7 @@ FINAL_RESULT_PKL_FILES = [
     "green_capacity_ratio",
     "cost_of_steelmaking",
     "levelized_cost_results",
-]
+)
 
 ITERATION_FILES_TO_AGGREGATE = [
     "production_resource_usage",
@@ -1,4 +1,7 @@
 """Manages data imports"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 # For Data Manipulation
 import pandas as pd
 
@@ -39,10 +42,9 @@ def replace_rows(df: pd.DataFrame, header_row: int) -> pd.DataFrame:
     Returns:
         DataFrame: A reformatted DataFrame
     """
-    df_c = df.copy()
     # grab the first row for the header
-    new_header = df_c.iloc[header_row]
-    # take the data less the header row
+    new_header = df.iloc[header_row]
+    # take the data less the header row (slicing already returns a new frame)
     df_c = df[header_row + 1 :]
     # set the header row as the df header
     df_c.columns = new_header
@@ -76,83 +78,83 @@ def load_import_data(serialize: bool = False) -> dict:
     Returns:
         dict: A dictionary with all the data from the imported files.
     """
-    # Import capex numbers
-    greenfield_capex = extract_data(
-        IMPORT_DATA_PATH, "CAPEX OPEX Per Technology", "xlsx", 0
-    )
-    brownfield_capex = extract_data(
-        IMPORT_DATA_PATH, "CAPEX OPEX Per Technology", "xlsx", 1
-    )
-    other_opex = extract_data(IMPORT_DATA_PATH, "CAPEX OPEX Per Technology", "xlsx", 2)
-    # Import ccs co2 capacity numbers
-    ccs_co2 = extract_data(IMPORT_DATA_PATH, "CO2 CCU Capacity", "csv")
-    # Import country reference
-    country_ref = extract_data(IMPORT_DATA_PATH, "Country Reference", "xlsx").fillna("")
-    # Import emissions factors
-    s1_emissions_factors = extract_data(
-        IMPORT_DATA_PATH, "Scope 1 Emissions Factors", "xlsx"
-    )
-    # Import scope 3 EF data
-    s3_emissions_factors_1 = extract_data(
-        IMPORT_DATA_PATH, "Scope 3 Emissions Factors", "xlsx", 0
-    )
-    s3_emissions_factors_2 = pd.read_excel(
-        f"{IMPORT_DATA_PATH}/Scope 3 Emissions Factors.xlsx",
-        sheet_name=1,
-        skiprows=1,
-    )
-    # Import static energy prices
-    static_energy_prices = extract_data(
-        IMPORT_DATA_PATH, "Energy Prices - Static", "xlsx"
-    )
-    # Import feedstock prices
-    feedstock_prices = extract_data(IMPORT_DATA_PATH, "Feedstock Prices", "xlsx")
-    # Import steel plant data
-    steel_plants = extract_data(IMPORT_DATA_PATH, "Steel Plant Data Anon", "xlsx")
-    # Import technology availability
-    tech_availability = extract_data(IMPORT_DATA_PATH, "Technology Availability", "csv")
-    # Import Commodities Data
-    plastic_prices = extract_data(IMPORT_DATA_PATH, "Plastic Prices", "csv")
-    # Import Regional Steel Demand Data
-    regional_steel_demand = extract_data(
-        IMPORT_DATA_PATH, "Regional Steel Demand", "csv"
-    )
-    # WSA data
-    wsa_production = extract_data(IMPORT_DATA_PATH, "WSA Production 2020", "csv")
-    # Fossil Fuel Data
-    fossil_fuel_model = extract_data(IMPORT_DATA_PATH, "Fossil Fuel Model", "csv")
-    # Import Price and Emissions Models
-    power_model = get_pe_model_data("power")
-    hydrogen_model = get_pe_model_data("hydrogen")
-    bio_model = get_pe_model_data("bio")
-    ccs_model = get_pe_model_data("ccs")
-    technology_business_cases = extract_data(
-        IMPORT_DATA_PATH, "Technology Business Cases", "csv"
-    )
+    def load_capex_sheets() -> tuple:
+        # shared workbook: open the file once for all three sheets
+        with pd.ExcelFile(
+            f"{IMPORT_DATA_PATH}/CAPEX OPEX Per Technology.xlsx"
+        ) as capex_wb:
+            return (
+                pd.read_excel(capex_wb, sheet_name=0),
+                pd.read_excel(capex_wb, sheet_name=1),
+                pd.read_excel(capex_wb, sheet_name=2),
+            )
+
+    def load_s3_sheets() -> tuple:
+        # shared workbook: open the file once for both sheets
+        with pd.ExcelFile(f"{IMPORT_DATA_PATH}/Scope 3 Emissions Factors.xlsx") as s3_wb:
+            return (
+                pd.read_excel(s3_wb, sheet_name=0),
+                pd.read_excel(s3_wb, sheet_name=1, skiprows=1),
+            )
+
+    # Each file is independent, so reads are dispatched to a thread pool:
+    # openpyxl / the csv parser release the GIL during I/O and decompression.
+    import_jobs = {
+        "capex_sheets": load_capex_sheets,
+        "s3_sheets": load_s3_sheets,
+        "ccs_co2": lambda: extract_data(IMPORT_DATA_PATH, "CO2 CCU Capacity", "csv"),
+        "country_ref": lambda: extract_data(
+            IMPORT_DATA_PATH, "Country Reference", "xlsx"
+        ).fillna(""),
+        "s1_emissions_factors": lambda: extract_data(
+            IMPORT_DATA_PATH, "Scope 1 Emissions Factors", "xlsx"
+        ),
+        "static_energy_prices": lambda: extract_data(
+            IMPORT_DATA_PATH, "Energy Prices - Static", "xlsx"
+        ),
+        "feedstock_prices": lambda: extract_data(
+            IMPORT_DATA_PATH, "Feedstock Prices", "xlsx"
+        ),
+        "steel_plants": lambda: extract_data(
+            IMPORT_DATA_PATH, "Steel Plant Data Anon", "xlsx"
+        ),
+        "tech_availability": lambda: extract_data(
+            IMPORT_DATA_PATH, "Technology Availability", "csv"
+        ),
+        "plastic_prices": lambda: extract_data(
+            IMPORT_DATA_PATH, "Plastic Prices", "csv"
+        ),
+        "regional_steel_demand": lambda: extract_data(
+            IMPORT_DATA_PATH, "Regional Steel Demand", "csv"
+        ),
+        "wsa_production": lambda: extract_data(
+            IMPORT_DATA_PATH, "WSA Production 2020", "csv"
+        ),
+        "fossil_fuel_model": lambda: extract_data(
+            IMPORT_DATA_PATH, "Fossil Fuel Model", "csv"
+        ),
+        "power_model": lambda: get_pe_model_data("power"),
+        "hydrogen_model": lambda: get_pe_model_data("hydrogen"),
+        "bio_model": lambda: get_pe_model_data("bio"),
+        "ccs_model": lambda: get_pe_model_data("ccs"),
+        "technology_business_cases": lambda: extract_data(
+            IMPORT_DATA_PATH, "Technology Business Cases", "csv"
+        ),
+    }
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        futures = {name: executor.submit(job) for name, job in import_jobs.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    greenfield_capex, brownfield_capex, other_opex = results.pop("capex_sheets")
+    s3_emissions_factors_1, s3_emissions_factors_2 = results.pop("s3_sheets")
 
     # Define a data dictionary
     df_dict = {
         "greenfield_capex": greenfield_capex,
         "brownfield_capex": brownfield_capex,
         "other_opex": other_opex,
-        "ccs_co2": ccs_co2,
-        "country_ref": country_ref,
-        "s1_emissions_factors": s1_emissions_factors,
-        "static_energy_prices": static_energy_prices,
-        "feedstock_prices": feedstock_prices,
-        "regional_steel_demand": regional_steel_demand,
-        "steel_plants": steel_plants,
-        "tech_availability": tech_availability,
         "s3_emissions_factors_1": s3_emissions_factors_1,
         "s3_emissions_factors_2": s3_emissions_factors_2,
-        "technology_business_cases": technology_business_cases,
-        "plastic_prices": plastic_prices,
-        "power_model": power_model,
-        "hydrogen_model": hydrogen_model,
-        "bio_model": bio_model,
-        "ccs_model": ccs_model,
-        "wsa_production": wsa_production,
-        "fossil_fuel_model": fossil_fuel_model,
+        **results,
     }
 
     if serialize:
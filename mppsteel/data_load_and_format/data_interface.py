@@ -113,6 +113,26 @@ def modify_scope3_ef_1(
     return scope3_df
 
 
+def flat_capex_ref(capex_dict: dict) -> dict:
+    """Builds (and memoizes) flat `{(technology, year): value}` lookups for a capex dictionary.
+
+    The lookups are stored on the capex dictionary itself under a private key,
+    so they live exactly as long as the dictionary they were built from.
+
+    Args:
+        capex_dict (dict): A capex dictionary with each capex type as a DataFrame.
+
+    Returns:
+        dict: A dictionary of flat value lookups, one per capex type.
+    """
+    if "_flat_ref" not in capex_dict:
+        capex_dict["_flat_ref"] = {
+            capex_type: capex_dict[capex_type]["value"].to_dict()
+            for capex_type in ("greenfield", "brownfield", "other_opex")
+        }
+    return capex_dict["_flat_ref"]
+
+
 def capex_generator(
     capex_dict: dict, technology: str, year: int, output_type: str = "all"
 ) -> Union[dict, pd.DataFrame]:
@@ -127,10 +147,10 @@ def capex_generator(
     Returns:
         Union[dict, pd.DataFrame]: A (dict) if output_type is set to 'all'. Otherwise returns the specific output_type specified (as float).
     """
-
-    greenfield = capex_dict["greenfield"].loc[technology, year].value
-    brownfield = capex_dict["brownfield"].loc[technology, year].value
-    other_opex = capex_dict["other_opex"].loc[technology, year].value
+    flat_ref = flat_capex_ref(capex_dict)
+    greenfield = flat_ref["greenfield"][(technology, year)]
+    brownfield = flat_ref["brownfield"][(technology, year)]
+    other_opex = flat_ref["other_opex"][(technology, year)]
 
     capex_dict = {
         "greenfield": greenfield,
@@ -162,24 +182,58 @@ def capex_dictionary_generator(
         dict: A dictionary of the formatted capex and opex dataframes.
     """
     index_cols = ["Technology", "Year"]
-    gf_df = melt_and_index(greenfield_df, ["Technology"], "Year", index_cols)
-    bf_df = melt_and_index(brownfield_df, ["Technology"], "Year", index_cols)
-    oo_df = melt_and_index(other_df, ["Technology"], "Year", index_cols)
-    gf_df = convert_currency_col(gf_df, "value", eur_to_usd)
-    bf_df = convert_currency_col(bf_df, "value", eur_to_usd)
-    oo_df = convert_currency_col(oo_df, "value", eur_to_usd)
-
-    gf_df = extend_df_years(gf_df, "Year", MODEL_YEAR_END, index_cols)
-    bf_df = extend_df_years(bf_df, "Year", MODEL_YEAR_END, index_cols)
-    oo_df = extend_df_years(oo_df, "Year", MODEL_YEAR_END, index_cols)
-
+    frames = {
+        "greenfield": greenfield_df,
+        "brownfield": brownfield_df,
+        "other_opex": other_df,
+    }
+    # one combined pass over a single long frame with a capex_type level
+    # instead of three separate convert/extend pipelines
+    combined = pd.concat(
+        {
+            capex_type: melt_and_index(df, ["Technology"], "Year", index_cols)
+            for capex_type, df in frames.items()
+        },
+        names=["capex_type"],
+    )
+    combined = convert_currency_col(combined, "value", eur_to_usd)
+    combined = extend_df_years(
+        combined, "Year", MODEL_YEAR_END, ["capex_type", *index_cols]
+    )
     return {
-        "greenfield": gf_df,
-        "brownfield": bf_df,
-        "other_opex": oo_df,
+        capex_type: combined.xs(capex_type, level="capex_type")
+        for capex_type in frames
     }
 
 
+def create_capex_cube(capex_dict: dict) -> tuple:
+    """Flattens a capex dictionary into a dense NumPy cube for batch access.
+
+    Args:
+        capex_dict (dict): A capex dictionary with each capex type as a DataFrame.
+
+    Returns:
+        tuple: A (cube, tech_index, year_index) tuple. The cube has shape
+        (3, n_technologies, n_years) ordered greenfield / brownfield / other_opex,
+        and the two index dicts map labels to their positions in the cube.
+    """
+    greenfield_wide = capex_dict["greenfield"]["value"].unstack("Year")
+    technologies = list(greenfield_wide.index)
+    years = list(greenfield_wide.columns)
+    cube = np.stack(
+        [
+            capex_dict[capex_type]["value"]
+            .unstack("Year")
+            .reindex(index=technologies, columns=years)
+            .to_numpy()
+            for capex_type in ("greenfield", "brownfield", "other_opex")
+        ]
+    )
+    tech_index = {technology: i for i, technology in enumerate(technologies)}
+    year_index = {year: i for i, year in enumerate(years)}
+    return cube, tech_index, year_index
+
+
 @pa.check_input(PLASTIC_SCHEMA)
 def format_commodities_data(df: pd.DataFrame, material_mapper: dict) -> pd.DataFrame:
     """Formats the Commodities dataset.
@@ -218,11 +218,6 @@ def steel_demand_getter(
     Returns:
         float: The demand value for the inputted data.
     """
-    df_c = df.copy()
-    # define country list based on the data_type
-    region_list = list(df_c["region"].unique())
-    country_list = get_unique_countries(df_c["country_code"].values)
-
     if not region and not country_code:
         raise AttributeError(
             "Neither `region` or `country_code` attributes were entered. Enter a valid option for one."
@@ -234,7 +229,11 @@ def steel_demand_getter(
             "You entered both region and country_code attributes were entered. Enter a valid option for one."
         )
 
+    # boolean masks on the original frame avoid a full per-call copy
+    df_c = df
+
     if region:
+        region_list = list(df_c["region"].unique())
         if region in region_list:
             df_c = df_c[df_c["region"].str.contains(region, regex=False)]
         elif force_default:
@@ -248,6 +247,7 @@ def steel_demand_getter(
             )
 
     if country_code:
+        country_list = get_unique_countries(df_c["country_code"].values)
         if country_code in country_list:
             df_c = df_c[df_c["country_code"].str.contains(country_code, regex=False)]
         elif force_default:
@@ -279,4 +279,4 @@ def steel_demand_getter(
     )
     df_c.reset_index(drop=True, inplace=True)
     # Return the value figure
-    return df_c.value.values[0]
+    return df_c.value.iat[0]
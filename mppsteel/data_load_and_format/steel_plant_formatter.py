@@ -182,8 +182,8 @@ def map_plant_id_to_df(
     df_c = df.copy()
     if reverse:
         id_plant_dict = {v: k for k, v in plant_id_dict.items()}
-        df_c["plant_name"] = df_c[plant_identifier].apply(lambda x: id_plant_dict[x])
-    df_c["plant_id"] = df_c[plant_identifier].apply(lambda x: plant_id_dict[x])
+        df_c["plant_name"] = df_c[plant_identifier].map(id_plant_dict)
+    df_c["plant_id"] = df_c[plant_identifier].map(plant_id_dict)
     return df_c
 
 
@@ -1,9 +1,8 @@
 """Script for establishing capex switching values"""
 
 # For Data Manipulation
-from typing import Dict
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 # For logger
 from mppsteel.utility.function_timer_utility import timer_func
@@ -17,281 +16,160 @@ from mppsteel.config.reference_lists import (
     TECH_REFERENCE_LIST,
     SWITCH_DICT,
 )
-from mppsteel.data_load_and_format.data_interface import capex_generator
+from mppsteel.data_load_and_format.data_interface import create_capex_cube
 
 
 logger = get_logger(__name__)
 
 
-def create_switching_dfs(technology_list: list) -> dict:
-    """Creates a dictionary that hold a DataFrame with three columns fo each tehnology passed to it in a list.
+def _switch_capex_terms(technology: str, new_technology: str):
+    """Expresses the switch capex rule for a (start, new) technology pair.
 
     Args:
-        technology_list (list): A list of technologies that will be the dictionary keys.
+        technology (str): The technology the plant is switching from.
+        new_technology (str): The technology the plant is switching to.
 
     Returns:
-        dict: A dictionary with each key as the technologies.
+        Union[tuple, None]: A (constant, terms) pair where terms is a list of
+        (scale, capex_type, technology) contributions, or None when no switch
+        value is defined for the pair.
     """
-    logger.info("Creating the base switching dict")
-    df_dict = {}
-    for technology in technology_list:
-        df_temp = pd.DataFrame(
-            data={
-                "Start Technology": technology,
-                "New Technology": technology_list,
-                "value": "",
-            }
-        )
-        df_dict[technology] = df_temp
-    return df_dict
+    if technology == new_technology:
+        return 0.0, [(1, "brownfield", technology)]
 
+    if new_technology == "Close plant":
+        return 0.0, [(0.05, "greenfield", technology)]
+
+    if (
+        technology in FURNACE_GROUP_DICT["blast_furnace"]
+        and new_technology in FURNACE_GROUP_DICT["blast_furnace"]
+    ):
+        if new_technology == "BAT BF-BOF":
+            return 0.0, [(1, "brownfield", new_technology)]
+        if new_technology in {"BAT BF-BOF+CCUS", "BAT BF-BOF+CCU", "BAT BF-BOF+BECCUS"}:
+            return 0.0, [
+                (1, "brownfield", "BAT BF-BOF"),
+                (1, "greenfield", new_technology),
+                (-1, "greenfield", technology),
+            ]
+        # bio PCI or H2PCI
+        if technology == "Avg BF-BOF":
+            return 0.0, [(1, "brownfield", "BAT BF-BOF")]
+        # technology is BAT BF BOF
+        return 0.0, [(1, "brownfield", technology)]
+
+    if (
+        technology in FURNACE_GROUP_DICT["dri-bof"]
+        and new_technology in FURNACE_GROUP_DICT["dri-bof"]
+    ):
+        if new_technology == "DRI-Melt-BOF_100% zero-C H2":
+            return 0.0, [(1, "brownfield", technology)]
+        # 'DRI-Melt-BOF + CCUS'
+        return 0.0, [
+            (1, "brownfield", technology),
+            (1, "greenfield", new_technology),
+            (-1, "greenfield", technology),
+        ]
+
+    if (
+        technology in FURNACE_GROUP_DICT["dri-eaf"]
+        and new_technology in FURNACE_GROUP_DICT["dri-eaf"]
+    ):
+        if new_technology in {
+            "DRI-EAF_50% bio-CH4",
+            "DRI-EAF_50% green H2",
+            "DRI-EAF_100% green H2",
+        }:
+            return 0.0, [(1, "brownfield", technology)]
+        # new_technology='DRI-EAF+CCUS'
+        return 0.0, [
+            (1, "brownfield", technology),
+            (1, "greenfield", new_technology),
+            (-1, "greenfield", technology),
+        ]
+
+    if (
+        technology in FURNACE_GROUP_DICT["smelting_reduction"]
+        and new_technology in FURNACE_GROUP_DICT["smelting_reduction"]
+    ):
+        return 0.0, [
+            (1, "brownfield", technology),
+            (1, "greenfield", new_technology),
+            (-1, "greenfield", technology),
+        ]
+
+    if (
+        technology in FURNACE_GROUP_DICT["blast_furnace"]
+        and new_technology in FURNACE_GROUP_DICT["dri-bof"]
+    ):
+        if new_technology == "DRI-Melt-BOF+CCUS":
+            return -460 / 4, [(1, "greenfield", new_technology)]
+        if new_technology in {"DRI-Melt-BOF", "DRI-Melt-BOF_100% zero-C H2"}:
+            return 0.0, [(1, "greenfield", "DRI-EAF"), (-1, "greenfield", "EAF")]
+        return None
+
+    if (
+        technology in FURNACE_GROUP_DICT["dri-eaf"]
+        and new_technology in FURNACE_GROUP_DICT["eaf-advanced"]
+    ):
+        return 0.0, [
+            (1, "greenfield", new_technology),
+            (-1, "greenfield", "EAF"),
+            (1, "brownfield", "EAF"),
+        ]
+
+    return 0.0, [(1, "greenfield", new_technology)]
 
-def get_capex_values(
-    df_switching_dict: dict,
-    capex_dict_ref: dict,
-) -> pd.DataFrame:
-    """Assign values to the a DataFrame based on start and potential switching technology.
+
+def get_capex_values(capex_dict_ref: dict) -> pd.DataFrame:
+    """Creates a switch capex value for each start and potential switching technology.
 
     Args:
-        df_switching_dict (dict): A dictionary with each technology as the key.
         capex_dict_ref (dict): A dictionary with greenfield, brownfield and other_opex values for each technology.
-        year_end (int): A integer year value containing the last year of the model.
 
     Returns:
-        pd.DataFrame: A dictionary with capex values for each technology.
+        pd.DataFrame: A DataFrame with a capex value for each (year, start, new) technology switch.
     """
     logger.info("Generating the capex values for each technology")
-    df_dict_c = df_switching_dict.copy()
 
-    year_list = []
-    for year in tqdm(
-        MODEL_YEAR_RANGE, total=len(MODEL_YEAR_RANGE), desc="Get Capex Values"
-    ):
-        tech_list = []
-        for technology in SWITCH_DICT:
-            df_temp = df_dict_c[technology].copy()
-            for new_technology in SWITCH_DICT[technology]:
-                capex_difference = (
-                    capex_generator(capex_dict_ref, new_technology, year)["greenfield"]
-                    - capex_generator(capex_dict_ref, technology, year)["greenfield"]
+    # The switch rules are year-independent, so each (start, new) pair is
+    # resolved to its weighted terms once and the values for all model years
+    # are computed with vectorized operations on the dense capex cube.
+    cube, tech_index, year_index = create_capex_cube(capex_dict_ref)
+    year_columns = [year_index[year] for year in MODEL_YEAR_RANGE]
+    capex_tables = {
+        "greenfield": cube[0][:, year_columns],
+        "brownfield": cube[1][:, year_columns],
+    }
+
+    start_techs = []
+    new_techs = []
+    value_rows = []
+    for technology in SWITCH_DICT:
+        for new_technology in SWITCH_DICT[technology]:
+            rule = _switch_capex_terms(technology, new_technology)
+            if rule is None:
+                continue
+            constant, terms = rule
+            values = np.full(len(year_columns), constant)
+            for scale, capex_type, term_technology in terms:
+                values += (
+                    scale * capex_tables[capex_type][tech_index[term_technology]]
                 )
-                if technology == new_technology:
-                    brownfield_capex_value = capex_generator(
-                        capex_dict_ref, technology, year
-                    )["brownfield"]
-                    df_temp.loc[
-                        (df_temp["Start Technology"] == technology)
-                        & (df_temp["New Technology"] == technology),
-                        "value",
-                    ] = brownfield_capex_value
-
-                elif new_technology == "Close plant":
-                    switch_capex_value = (
-                        capex_generator(capex_dict_ref, technology, year)["greenfield"]
-                        * 0.05
-                    )
-                    df_temp.loc[
-                        (df_temp["Start Technology"] == technology)
-                        & (df_temp["New Technology"] == new_technology),
-                        "value",
-                    ] = switch_capex_value
-
-                else:
-                    if (
-                        technology in FURNACE_GROUP_DICT["blast_furnace"]
-                        and new_technology in FURNACE_GROUP_DICT["blast_furnace"]
-                    ):
-                        if new_technology == "BAT BF-BOF":
-                            switch_capex_value = capex_generator(
-                                capex_dict_ref, new_technology, year
-                            )["brownfield"]
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-
-                        elif (
-                            new_technology == "BAT BF-BOF+CCUS"
-                            or new_technology == "BAT BF-BOF+CCU"
-                            or new_technology == "BAT BF-BOF+BECCUS"
-                        ):
-
-                            switch_capex_value = (
-                                capex_generator(capex_dict_ref, "BAT BF-BOF", year)[
-                                    "brownfield"
-                                ]
-                                + capex_difference
-                            )
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-
-                        else:  # bio PCI or H2PCI
-                            if technology == "Avg BF-BOF":
-                                switch_capex_value = capex_generator(
-                                    capex_dict_ref, "BAT BF-BOF", year
-                                )["brownfield"]
-                                df_temp.loc[
-                                    (df_temp["Start Technology"] == technology)
-                                    & (df_temp["New Technology"] == new_technology),
-                                    "value",
-                                ] = switch_capex_value
-
-                            else:  # technology is BAT BF BOF
-                                switch_capex_value = capex_generator(
-                                    capex_dict_ref, technology, year
-                                )["brownfield"]
-                                df_temp.loc[
-                                    (df_temp["Start Technology"] == technology)
-                                    & (df_temp["New Technology"] == new_technology),
-                                    "value",
-                                ] = switch_capex_value
-
-                    elif (
-                        technology in FURNACE_GROUP_DICT["dri-bof"]
-                        and new_technology in FURNACE_GROUP_DICT["dri-bof"]
-                    ):
-                        if new_technology == "DRI-Melt-BOF_100% zero-C H2":
-                            switch_capex_value = capex_generator(
-                                capex_dict_ref, technology, year
-                            )["brownfield"]
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-
-                        else:  # 'DRI-Melt-BOF + CCUS'
-                            switch_capex_value = (
-                                capex_generator(capex_dict_ref, technology, year)[
-                                    "brownfield"
-                                ]
-                                + capex_difference
-                            )
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-
-                    elif (
-                        technology in FURNACE_GROUP_DICT["dri-eaf"]
-                        and new_technology in FURNACE_GROUP_DICT["dri-eaf"]
-                    ):
-                        if (
-                            new_technology == "DRI-EAF_50% bio-CH4"
-                            or new_technology == "DRI-EAF_50% green H2"
-                            or new_technology == "DRI-EAF_100% green H2"
-                        ):
-                            switch_capex_value = capex_generator(
-                                capex_dict_ref, technology, year
-                            )["brownfield"]
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-
-                        else:  # new_technology='DRI-EAF+CCUS':
-                            switch_capex_value = (
-                                capex_generator(capex_dict_ref, technology, year)[
-                                    "brownfield"
-                                ]
-                                + capex_difference
-                            )
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-
-                    elif (
-                        technology in FURNACE_GROUP_DICT["smelting_reduction"]
-                        and new_technology in FURNACE_GROUP_DICT["smelting_reduction"]
-                    ):
-                        switch_capex_value = (
-                            capex_generator(capex_dict_ref, technology, year)[
-                                "brownfield"
-                            ]
-                            + capex_difference
-                        )
-                        df_temp.loc[
-                            (df_temp["Start Technology"] == technology)
-                            & (df_temp["New Technology"] == new_technology),
-                            "value",
-                        ] = switch_capex_value
-
-                    elif (
-                        technology in FURNACE_GROUP_DICT["blast_furnace"]
-                        and new_technology in FURNACE_GROUP_DICT["dri-bof"]
-                    ):
-                        if new_technology == "DRI-Melt-BOF+CCUS":
-                            switch_capex_value = (
-                                capex_generator(capex_dict_ref, new_technology, year)[
-                                    "greenfield"
-                                ]
-                                - 460 / 4
-                            )
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-
-                        elif (
-                            new_technology == "DRI-Melt-BOF"
-                            or new_technology == "DRI-Melt-BOF_100% zero-C H2"
-                        ):
-                            switch_capex_value = (
-                                capex_generator(capex_dict_ref, "DRI-EAF", year)[
-                                    "greenfield"
-                                ]
-                                - capex_generator(capex_dict_ref, "EAF", year)[
-                                    "greenfield"
-                                ]
-                            )
-                            df_temp.loc[
-                                (df_temp["Start Technology"] == technology)
-                                & (df_temp["New Technology"] == new_technology),
-                                "value",
-                            ] = switch_capex_value
-                    elif (
-                        technology in FURNACE_GROUP_DICT["dri-eaf"]
-                        and new_technology in FURNACE_GROUP_DICT["eaf-advanced"]
-                    ):
-                        switch_capex_value = capex_generator(
-                            capex_dict_ref, new_technology, year
-                        )["greenfield"] - (
-                            capex_generator(capex_dict_ref, "EAF", year)["greenfield"]
-                            - capex_generator(capex_dict_ref, "EAF", year)["brownfield"]
-                        )
-                        df_temp.loc[
-                            (df_temp["Start Technology"] == technology)
-                            & (df_temp["New Technology"] == new_technology),
-                            "value",
-                        ] = switch_capex_value
-
-                    else:
-                        switch_capex_value = capex_generator(
-                            capex_dict_ref, new_technology, year
-                        )["greenfield"]
-                        df_temp.loc[
-                            (df_temp["Start Technology"] == technology)
-                            & (df_temp["New Technology"] == new_technology),
-                            "value",
-                        ] = switch_capex_value
-            df_temp = df_temp.loc[df_temp["value"] != ""]
-            df_temp["Year"] = year
-            tech_list.append(df_temp)
-        combined_tech_df = pd.concat(tech_list)
-        year_list.append(combined_tech_df)
-    combined_year_df = pd.concat(year_list)
+            start_techs.append(technology)
+            new_techs.append(new_technology)
+            value_rows.append(values)
 
+    n_years = len(year_columns)
     return (
-        combined_year_df.reset_index(drop=True)
+        pd.DataFrame(
+            {
+                "Year": np.repeat(list(MODEL_YEAR_RANGE), len(start_techs)),
+                "Start Technology": start_techs * n_years,
+                "New Technology": new_techs * n_years,
+                "value": np.vstack(value_rows).T.ravel(),
+            }
+        )
         .set_index(["Year"])
         .sort_index(ascending=True)
     )
@@ -329,28 +207,36 @@ def create_greenfield_switching_df(
         pd.DataFrame: A switch capex dataframe for the greenfield dataset.
     """
 
-    def switch_mapper(row: pd.Series, ref_dict: dict):
-        return ref_dict[row.switch_tech] - ref_dict[row.base_tech]
-
-    df_container = []
-    for year in tqdm(year_range, total=len(year_range), desc="Greenfield Switch Dict"):
-        df = gf_df.loc[year].copy()
-        ref_dict = dict(zip(df["base_tech"], df["value"]))
-        technology_df_ref: Dict[str, pd.DataFrame] = {
-            tech: pd.DataFrame(
-                {"year": year, "base_tech": tech, "switch_tech": SWITCH_DICT[tech]}
-            )
+    logger.info("Creating the greenfield switching DataFrame")
+    # The (base_tech, switch_tech) pairs are identical for every year, so the
+    # skeleton is built once and cross-joined with the years instead of
+    # assembling per-tech DataFrames inside a year loop.
+    skeleton = pd.concat(
+        [
+            pd.DataFrame({"base_tech": tech, "switch_tech": SWITCH_DICT[tech]})
             for tech in TECH_REFERENCE_LIST
-        }
-        technology_df_combined: pd.DataFrame = pd.concat(technology_df_ref.values())
-        technology_df_combined["switch_value"] = technology_df_combined.apply(
-            switch_mapper, ref_dict=ref_dict, axis=1
+        ],
+        ignore_index=True,
+    )
+    value_ref = gf_df.reset_index()[["year", "base_tech", "value"]]
+    combined = (
+        pd.DataFrame({"year": list(year_range)})
+        .merge(skeleton, how="cross")
+        .merge(
+            value_ref.rename({"value": "base_value"}, axis=1),
+            on=["year", "base_tech"],
         )
-        technology_df_combined.set_index(
-            ["year", "base_tech", "switch_tech"], inplace=True
+        .merge(
+            value_ref.rename(
+                {"base_tech": "switch_tech", "value": "switch_tech_value"}, axis=1
+            ),
+            on=["year", "switch_tech"],
         )
-        df_container.append(technology_df_combined)
-    return pd.concat(df_container)
+    )
+    combined["switch_value"] = combined["switch_tech_value"] - combined["base_value"]
+    return combined.drop(["base_value", "switch_tech_value"], axis=1).set_index(
+        ["year", "base_tech", "switch_tech"]
+    )
 
 
 @timer_func
@@ -363,14 +249,9 @@ def create_capex_timeseries(serialize: bool = False) -> dict:
     Returns:
         dict: A dictionary of two DataFrames -> One for general capex switching, and one only for the greenfield capex switch values.
     """
-    logger.info("Creating the base switching dict")
-    switching_dict = create_switching_dfs(TECH_REFERENCE_LIST)
     capex_dict = read_pickle_folder(PKL_DATA_FORMATTED, "capex_dict")
 
-    switching_df_with_capex = get_capex_values(
-        df_switching_dict=switching_dict,
-        capex_dict_ref=capex_dict,
-    )
+    switching_df_with_capex = get_capex_values(capex_dict_ref=capex_dict)
     greenfield_df_f = greenfield_preprocessing(capex_dict["greenfield"])
     greenfield_switch_df = create_greenfield_switching_df(
         greenfield_df_f, MODEL_YEAR_RANGE
@@ -213,55 +213,29 @@ STEEL_BUSINESS_CASES_SCHEMA = DataFrameSchema(
 )
 
 
-def import_data_tests():
-    """Example data tests."""
-    country_ref = read_pickle_folder(PKL_DATA_IMPORTS, "country_ref")
-    COUNTRY_REF_SCHEMA.validate(country_ref)
-
-    feedstock_prices = read_pickle_folder(PKL_DATA_IMPORTS, "feedstock_prices")
-    FEEDSTOCK_INPUT_SCHEMA.validate(feedstock_prices)
-
-    steel_plants = read_pickle_folder(PKL_DATA_IMPORTS, "steel_plants")
-    STEEL_PLANT_DATA_SCHEMA.validate(
-        steel_plants
-    )  # will fail due to 'anticipated and NaNs'
-
-    greenfield_capex = read_pickle_folder(PKL_DATA_IMPORTS, "greenfield_capex")
-    brownfield_capex = read_pickle_folder(PKL_DATA_IMPORTS, "brownfield_capex")
-    other_opex = read_pickle_folder(PKL_DATA_IMPORTS, "other_opex")
-
-    for capex_df in [greenfield_capex, brownfield_capex, other_opex]:
-        CAPEX_OPEX_PER_TECH_SCHEMA.validate(capex_df)
-
-    s3_emissions_factors_1 = read_pickle_folder(
-        PKL_DATA_IMPORTS, "s3_emissions_factors_1"
-    )
-    SCOPE3_EF_SCHEMA_1.validate(s3_emissions_factors_1)
-
-    s3_emissions_factors_2 = read_pickle_folder(
-        PKL_DATA_IMPORTS, "s3_emissions_factors_2"
-    )
-    SCOPE3_EF_SCHEMA_2.validate(s3_emissions_factors_2)
+IMPORT_DATA_TESTS = [
+    ("country_ref", COUNTRY_REF_SCHEMA),
+    ("feedstock_prices", FEEDSTOCK_INPUT_SCHEMA),
+    ("steel_plants", STEEL_PLANT_DATA_SCHEMA),  # will fail due to 'anticipated and NaNs'
+    ("greenfield_capex", CAPEX_OPEX_PER_TECH_SCHEMA),
+    ("brownfield_capex", CAPEX_OPEX_PER_TECH_SCHEMA),
+    ("other_opex", CAPEX_OPEX_PER_TECH_SCHEMA),
+    ("s3_emissions_factors_1", SCOPE3_EF_SCHEMA_1),
+    ("s3_emissions_factors_2", SCOPE3_EF_SCHEMA_2),
+    ("plastic_prices", PLASTIC_SCHEMA),
+    ("s1_emissions_factors", SCOPE1_EF_SCHEMA),
+    ("static_energy_prices", ENERGY_PRICES_STATIC_SCHEMA),
+    ("tech_availability", TECH_AVAILABILIY_SCHEMA),
+    ("regional_steel_demand", REGIONAL_STEEL_DEMAND_SCHEMA),
+    ("ccs_co2", CO2_CCS_SCHEMA),
+    ("business_cases", STEEL_BUSINESS_CASES_SCHEMA),
+]
 
-    plastic_prices = read_pickle_folder(PKL_DATA_IMPORTS, "plastic_prices")
-    PLASTIC_SCHEMA.validate(plastic_prices)
 
-    s1_emissions_factors = read_pickle_folder(PKL_DATA_IMPORTS, "s1_emissions_factors")
-    SCOPE1_EF_SCHEMA.validate(s1_emissions_factors)
-
-    static_energy_prices = read_pickle_folder(PKL_DATA_IMPORTS, "static_energy_prices")
-    ENERGY_PRICES_STATIC_SCHEMA.validate(static_energy_prices)
-
-    tech_availability = read_pickle_folder(PKL_DATA_IMPORTS, "tech_availability")
-    TECH_AVAILABILIY_SCHEMA.validate(tech_availability)
-
-    regional_steel_demand = read_pickle_folder(
-        PKL_DATA_IMPORTS, "regional_steel_demand"
-    )
-    REGIONAL_STEEL_DEMAND_SCHEMA.validate(regional_steel_demand)
-
-    co2_ccs = read_pickle_folder(PKL_DATA_IMPORTS, "ccs_co2")
-    CO2_CCS_SCHEMA.validate(co2_ccs)
-
-    business_cases = read_pickle_folder(PKL_DATA_IMPORTS, "business_cases")
-    STEEL_BUSINESS_CASES_SCHEMA.validate(business_cases)
+def import_data_tests():
+    """Example data tests."""
+    # load-validate-discard so only one import frame is in memory at a time
+    for pickle_name, schema in IMPORT_DATA_TESTS:
+        df = read_pickle_folder(PKL_DATA_IMPORTS, pickle_name)
+        schema.validate(df, lazy=True)
+        del df
@@ -68,7 +68,6 @@ def investment_per_tech(
         investment_df.groupby(["end_tech", "region_rmi"])
         .agg({"capital_cost": "sum"})
         .reset_index()
-        .copy()
     )
     tech_inv_color_map = dict(
         zip_longest(tech_investment["end_tech"].unique(), MPP_COLOR_LIST)
@@ -1,6 +1,7 @@
 """Calculation Functions used to derive various forms of Cost of Steelmaking."""
-from typing import Dict, List, Union
+from typing import Dict, Union
 
+import numpy as np
 import pandas as pd
 
 from tqdm import tqdm
@@ -35,8 +36,8 @@ def create_region_plant_ref(df: pd.DataFrame, region_string: str) -> dict:
         dict: A dictionary containing a mapping of region to plant names
     """
     return {
-        region: list(df[df[region_string] == region]["plant_name"].unique())
-        for region in df[region_string].unique()
+        region: list(group["plant_name"].unique())
+        for region, group in df.groupby(region_string, sort=False)
     }
 
 
@@ -53,41 +54,95 @@ def extract_dict_values(
         float: A summation of the values in the dictionary.
     """
     if reference_dict and ref_key:
-        ref_list = reference_dict[ref_key]
-        return sum([main_dict[key] for key in main_dict if key in ref_list])
-    return sum([main_dict[key] for key in main_dict])
+        # set membership keeps the filter O(1) per key rather than a scan of the reference list
+        ref_set = set(reference_dict[ref_key])
+        return sum(main_dict[key] for key in main_dict if key in ref_set)
+    return sum(main_dict.values())
+
+
+def create_cost_array_refs(variable_costs_ref: dict, other_opex_ref: dict) -> dict:
+    """Re-encodes the tuple-keyed cost reference dicts as dense NumPy arrays.
+
+    Args:
+        variable_costs_ref (dict): A dictionary of variable costs keyed by (year, country_code, technology).
+        other_opex_ref (dict): A dictionary of other opex values keyed by (year, technology).
+
+    Returns:
+        dict: A dictionary containing the dense cost arrays and the integer code mapping for each key dimension.
+    """
+    years = sorted(
+        {year for year, _, _ in variable_costs_ref}
+        | {year for year, _ in other_opex_ref}
+    )
+    countries = sorted({country_code for _, country_code, _ in variable_costs_ref})
+    techs = sorted(
+        {tech for _, _, tech in variable_costs_ref} | {tech for _, tech in other_opex_ref}
+    )
+    year_codes = {year: index for index, year in enumerate(years)}
+    country_codes = {country_code: index for index, country_code in enumerate(countries)}
+    tech_codes = {tech: index for index, tech in enumerate(techs)}
+    variable_cost_arr = np.full((len(years), len(countries), len(techs)), np.nan)
+    for (year, country_code, tech), cost in variable_costs_ref.items():
+        variable_cost_arr[
+            year_codes[year], country_codes[country_code], tech_codes[tech]
+        ] = cost
+    other_opex_arr = np.full((len(years), len(techs)), np.nan)
+    for (year, tech), value in other_opex_ref.items():
+        other_opex_arr[year_codes[year], tech_codes[tech]] = value
+    return {
+        "variable_cost": variable_cost_arr,
+        "other_opex": other_opex_arr,
+        "year": year_codes,
+        "country": country_codes,
+        "tech": tech_codes,
+    }
 
 
 def apply_cos(
-    row: pd.Series,
+    df: pd.DataFrame,
     year: int,
     cap_dict: dict,
-    variable_costs_ref: pd.DataFrame,
-    capex_ref: dict,
-) -> float:
-    """Applies the Cost of Steelmaking function to a given row in a DataFrame.
+    cost_array_refs: dict,
+) -> np.ndarray:
+    """Applies the Cost of Steelmaking function to a DataFrame of production stats.
 
     Args:
-        row (pd.Series): A vectorized DataFrame row from .apply function.
+        df (pd.DataFrame): A DataFrame containing the production stats to calculate values for.
         year (int): The current year.
-        cap_dict (dict): A DataFrame containing the steel plant metadata.
-        variable_costs_ref (pd.DataFrame): A DataFrame containing the variable costs for each technology across each year and region.
-        capex_ref (dict): A dictionary containing the Capex values for Greenfield, Brownfield and Other Opex values.
+        cap_dict (dict): A dictionary containing the capacities of each plant.
+        cost_array_refs (dict): The dense cost arrays and code mappings from `create_cost_array_refs`.
 
     Returns:
-        float: The cost of Steelmaking value to be applied.
+        np.ndarray: The cost of Steelmaking values for each row in `df`.
     """
-
-    plant_capacity = cap_dict[row.plant_name]
-    variable_cost, other_opex_cost = (0, 0)
-    if row.technology:
-        variable_cost = variable_costs_ref[(year, row.country_code, row.technology)]
-        other_opex_cost = capex_ref["other_opex"][(year, row.technology)]
+    country_codes = cost_array_refs["country"]
+    tech_codes = cost_array_refs["tech"]
+    year_index = cost_array_refs["year"][year]
+    plant_capacity = df["plant_name"].map(cap_dict).to_numpy()
+    capacity_utilization = df["capacity_utilization"].to_numpy()
+    has_technology = np.array([bool(technology) for technology in df["technology"]])
+    country_index = np.fromiter(
+        (country_codes[country_code] for country_code in df["country_code"]),
+        dtype=np.intp,
+        count=len(df),
+    )
+    tech_index = np.fromiter(
+        (tech_codes[technology] if technology else 0 for technology in df["technology"]),
+        dtype=np.intp,
+        count=len(df),
+    )
+    variable_cost = np.where(
+        has_technology,
+        cost_array_refs["variable_cost"][year_index, country_index, tech_index],
+        0,
+    )
+    other_opex_cost = np.where(
+        has_technology, cost_array_refs["other_opex"][year_index, tech_index], 0
+    )
     full_cos_calc = plant_capacity * (
-        (variable_cost * row.capacity_utilization) + other_opex_cost
+        (variable_cost * capacity_utilization) + other_opex_cost
     )
-
-    return 0 if row.capacity_utilization == 0 else full_cos_calc
+    return np.where(capacity_utilization == 0, 0, full_cos_calc)
 
 
 def cost_of_steelmaking(
@@ -114,21 +169,16 @@ def cost_of_steelmaking(
         dict: A dictionary containing each year and the Cost of Steelmaking values.
     """
     plant_region_ref = create_region_plant_ref(production_df, region_group)
-    regions = production_df[region_group].unique()
     years = production_df["year"].unique()
-    production_stats_modified = production_df[cols_to_keep].set_index("year").copy()
+    production_stats_modified = production_df[cols_to_keep]
+    cost_array_refs = create_cost_array_refs(variable_costs_ref, capex_ref["other_opex"])
 
-    cos_year_list: List[Union[Dict[str, float], float]] = []
-
-    def calculate_cos(df, region_ref=None) -> float:
-        df_c = df.copy()
-        cos_values = df_c.apply(
-            apply_cos,
+    def calculate_cos(df, year, region_ref=None) -> float:
+        cos_values = apply_cos(
+            df,
             year=year,
             cap_dict=capacities_dict[year],
-            variable_costs_ref=variable_costs_ref,
-            capex_ref=capex_ref,
-            axis=1,
+            cost_array_refs=cost_array_refs,
         )
         cos_sum = cos_values.sum()
         capacity_sum = extract_dict_values(
@@ -138,22 +188,21 @@ def cost_of_steelmaking(
 
     desc = "Cost of Steelmaking without Captial Charges: Year Loop"
 
-    for year in tqdm(years, total=len(years), desc=desc):
-        ps_y = production_stats_modified.loc[year]
-
-        if regional:
-            ps_y = ps_y.set_index(region_group)
-            region_dict = {}
-            for region in regions:
-                ps_r = ps_y.loc[region]
-                cos_r = calculate_cos(ps_r, region)
-                region_dict[region] = cos_r
-            cos_year_list.append(region_dict)
+    if regional:
+        cos_values_ref: Dict[int, Dict[str, float]] = {year: {} for year in years}
+        grouped = production_stats_modified.groupby(["year", region_group], sort=False)
+        for (year, region), ps_r in tqdm(grouped, total=grouped.ngroups, desc=desc):
+            cos_values_ref[year][region] = calculate_cos(ps_r, year, region)
+        return cos_values_ref
 
-        else:
-            cos_final = calculate_cos(ps_y)
-            cos_year_list.append(cos_final)
-    return dict(zip(years, cos_year_list))
+    return {
+        year: calculate_cos(ps_y, year)
+        for year, ps_y in tqdm(
+            production_stats_modified.groupby("year", sort=False),
+            total=len(years),
+            desc=desc,
+        )
+    }
 
 
 def dict_to_df(df_values_dict: dict, region_group: str) -> pd.DataFrame:
@@ -167,12 +216,13 @@ def dict_to_df(df_values_dict: dict, region_group: str) -> pd.DataFrame:
         pd.DataFrame: A DataFrame containing the Cost of Steelmaking values.
     """
     value_col = "cost_of_steelmaking"
-    df_c = pd.DataFrame(df_values_dict).transpose().copy()
-    df_c = df_c.reset_index().rename(mapper={"index": "year"}, axis=1)
-    df_c = df_c.melt(id_vars=["year"], var_name=region_group, value_name=value_col)
-    return df_c.set_index(["year", region_group]).sort_values(
-        by=["year", region_group], axis=0
-    )
+    records = [
+        (year, region, value)
+        for year, region_values in df_values_dict.items()
+        for region, value in region_values.items()
+    ]
+    df_c = pd.DataFrame.from_records(records, columns=["year", region_group, value_col])
+    return df_c.set_index(["year", region_group]).sort_index()
 
 
 def create_cost_of_steelmaking_data(
@@ -242,6 +292,7 @@ def create_cost_of_steelmaking_data(
         plant_df, MODEL_YEAR_RANGE, inverse=True
     )
     investment_cost_ref = {}
+    range_sum_cache: dict = {}
     for year in tqdm(
         MODEL_YEAR_RANGE,
         total=len(MODEL_YEAR_RANGE),
@@ -254,7 +305,11 @@ def create_cost_of_steelmaking_data(
         ]
         for plant_name in active_plants:
             investment_cost_ref[(year, plant_name)] = get_investment_capital_costs(
-                investment_df, investment_dict_result_cycles_only, plant_name, year
+                investment_df,
+                investment_dict_result_cycles_only,
+                plant_name,
+                year,
+                range_sum_cache=range_sum_cache,
             )
 
     relining_span_ref = {}
@@ -29,6 +29,15 @@ from mppsteel.utility.location_utility import create_country_mapper
 
 logger = get_logger(__name__)
 
+INVESTMENT_RESULT_COLUMNS = [
+    "year",
+    "plant_name",
+    "start_tech",
+    "end_tech",
+    "switch_type",
+    "capital_cost",
+]
+
 
 def capex_getter_f(
     capex_ref: dict,
@@ -64,7 +73,7 @@ def capex_getter_f(
 
 
 def investment_row_calculator(
-    plant_investment_cycles: pd.DataFrame,
+    switch_type_ref: dict,
     switch_capex_ref: dict,
     greenfield_ref: dict,
     active_plant_checker_dict: dict,
@@ -72,11 +81,11 @@ def investment_row_calculator(
     capacity_ref: dict,
     year: int,
     plant_name: str,
-) -> dict:
+) -> tuple:
     """Calculates a row for the investment DataFrame by establishing the switch type for the plant in a particular year, and where necessary, applying a capex value.
 
     Args:
-        plant_investment_cycles (pd.DataFrame): The Investment cycle reference DataFrame.
+        switch_type_ref (dict): A dictionary mapping (year, plant_name) to the plant's switch type for that year.
         switch_capex_ref (dict): A switch capex reference.
         greenfield_ref (dict): Greenfield capex reference.
         active_plant_checker_dict (dict): Dictionary with values of whether a plant in a particular year was active or not.
@@ -86,9 +95,9 @@ def investment_row_calculator(
         plant_name (str): The name of the reference plant.
 
     Returns:
-        dict: A dictionary containing the column-value pairs to be inserted in a DataFrame.
+        tuple: The row values, ordered as INVESTMENT_RESULT_COLUMNS.
     """
-    switch_type = plant_investment_cycles.loc[year, plant_name]["switch_type"]
+    switch_type = switch_type_ref[(year, plant_name)]
     if year == MODEL_YEAR_START:
         start_tech = get_tech_choice(
             tech_choices, active_plant_checker_dict, MODEL_YEAR_START, plant_name
@@ -107,18 +116,11 @@ def investment_row_calculator(
             switch_capex_ref, greenfield_ref, year, start_tech, new_tech, switch_type
         )
         actual_capex = capex_value * (capacity_ref[plant_name] * MEGATON_TO_TON)
-    return {
-        "plant_name": plant_name,
-        "year": year,
-        "start_tech": start_tech,
-        "end_tech": new_tech,
-        "switch_type": switch_type,
-        "capital_cost": actual_capex,
-    }
+    return year, plant_name, start_tech, new_tech, switch_type, actual_capex
 
 
 def create_global_stats(df, operation: str = "sum") -> pd.DataFrame:
-    calc = df.groupby(["year"]).sum()
+    calc = df.groupby(["year"])[["capital_cost"]].sum()
     if operation == "cumsum":
         calc = calc.cumsum()
     return calc
@@ -142,6 +144,7 @@ def create_inv_stats(
         Union[pd.DataFrame, dict]: Returns a DataFrame if `results` is set to `global`. Returns a dict of regional results if `results` is set to `regional` and `agg` is set to False.
     """
 
+    # column selection is read-only downstream, so no defensive copy is needed
     df_c = df[
         [
             "year",
@@ -153,26 +156,28 @@ def create_inv_stats(
             "capital_cost",
             "region_rmi",
         ]
-    ].copy()
+    ]
 
     if global_results:
         return create_global_stats(df_c, operation).reset_index()
 
     regions = df_c["region_rmi"].unique()
+    # one grouped sum instead of a full-frame boolean filter per region;
+    # capital_cost is the only numeric column so it is selected explicitly
+    grouped = df_c.groupby(["region_rmi", "year"])[["capital_cost"]].sum()
     region_dict = {}
     for region in regions:
-        calc = df_c[df_c["region_rmi"] == region].groupby(["year"]).sum()
-        if operation == "sum":
-            pass
+        calc = grouped.xs(region, level="region_rmi").copy()
         if operation == "cumsum":
             calc = calc.cumsum()
         region_dict[region] = calc
     if agg:
-        df_list = []
-        for region_key in region_dict:
-            df_r = region_dict[region_key]
-            df_r["region"] = region_key
-            df_list.append(df_r[["region", "capital_cost"]])
+        df_list = [
+            region_dict[region_key].assign(region=region_key)[
+                ["region", "capital_cost"]
+            ]
+            for region_key in region_dict
+        ]
         return pd.concat(df_list).reset_index()
     return region_dict
 
@@ -228,6 +233,7 @@ def get_investment_capital_costs(
     investment_cycles: dict,
     plant_name: str,
     current_year: int,
+    range_sum_cache: Optional[dict] = None,
 ) -> float:
     """Calculates the investment costs within a specified range of years.
 
@@ -236,6 +242,7 @@ def get_investment_capital_costs(
         investment_cycles (dict): A dictionary of each plant's investment cycle.
         plant_name (str): The name of the plant.
         current_year (int): The current model cycle year.
+        range_sum_cache (Optional[dict], optional): A cache of capital cost sums keyed by (start, stop) of the cycle range. Plants with the same cycle range share the same sum, so callers looping over many plants should pass a shared dict. Defaults to None.
 
     Returns:
         float: Get capex costs within a specified range of years.
@@ -244,10 +251,16 @@ def get_investment_capital_costs(
         investment_cycles, plant_name, current_year, MODEL_YEAR_START, MODEL_YEAR_END
     )
 
-    if range_obj:
-        return investment_df.iloc[list(range_obj)]["capital_cost"].sum()
-    else:
+    if not range_obj:
         return 0
+    if range_sum_cache is None:
+        return investment_df.iloc[list(range_obj)]["capital_cost"].sum()
+    cache_key = (range_obj.start, range_obj.stop)
+    if cache_key not in range_sum_cache:
+        range_sum_cache[cache_key] = investment_df.iloc[list(range_obj)][
+            "capital_cost"
+        ].sum()
+    return range_sum_cache[cache_key]
 
 
 @timer_func
@@ -299,7 +312,8 @@ def investment_results(
         zip(plant_result_df["plant_name"], plant_result_df["country_code"])
     )
 
-    data_container = []
+    switch_type_ref = plant_investment_cycles["switch_type"].to_dict()
+    data_container: dict = {column: [] for column in INVESTMENT_RESULT_COLUMNS}
     for year in tqdm(
         MODEL_YEAR_RANGE,
         total=len(MODEL_YEAR_RANGE),
@@ -308,29 +322,26 @@ def investment_results(
         plant_names = plant_capacity_results[year].keys()
         for plant_name in plant_names:
             if active_check_results_dict[plant_name][year]:
-                data_container.append(
-                    investment_row_calculator(
-                        plant_investment_cycles,
-                        capex_ref,
-                        greenfield_capex_ref,
-                        active_check_results_dict,
-                        tech_choice_dict,
-                        plant_capacity_results[year],
-                        year,
-                        plant_name,
-                    )
+                row = investment_row_calculator(
+                    switch_type_ref,
+                    capex_ref,
+                    greenfield_capex_ref,
+                    active_check_results_dict,
+                    tech_choice_dict,
+                    plant_capacity_results[year],
+                    year,
+                    plant_name,
                 )
-    investment_results = (
-        pd.DataFrame(data_container).set_index(["year"]).sort_values("year")
-    )
+                for column, value in zip(INVESTMENT_RESULT_COLUMNS, row):
+                    data_container[column].append(value)
+    # the outer loop sweeps MODEL_YEAR_RANGE, so the buffers are already in
+    # year order and the set_index/sort_values/reset_index round trip is moot
+    investment_results = pd.DataFrame(data_container)
     rmi_mapper = create_country_mapper(country_ref)
-    investment_results["country_code"] = investment_results["plant_name"].apply(
-        lambda x: plant_country_code_ref[x]
-    )
-    investment_results["region"] = investment_results["country_code"].apply(
-        lambda x: rmi_mapper[x]
+    investment_results["country_code"] = investment_results["plant_name"].map(
+        plant_country_code_ref
     )
-    investment_results.reset_index(inplace=True)
+    investment_results["region"] = investment_results["country_code"].map(rmi_mapper)
     investment_results = map_plant_id_to_df(
         investment_results, plant_result_df, "plant_name"
     )
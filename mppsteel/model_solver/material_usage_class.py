@@ -409,10 +409,19 @@ def return_current_usage(
     Returns:
         float: The sum of the usage across the plants and materials specified in `materials`
     """
-    usage_sum = []
-    for material, plant_name in list(itertools.product(materials, plant_list)):
-        capacity = capacities_dict[plant_name]
-        consumption_rate = business_case_ref[(technology_choices[plant_name], material)]
-        utilization = CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION
-        usage_sum.append(consumption_rate * (capacity * utilization))
-    return sum(usage_sum)
+    # The summed consumption rate across `materials` only depends on the
+    # technology, so it is resolved once per technology rather than once per
+    # (material, plant) combination.
+    technology_rates: dict = {}
+    usage_sum = 0
+    for plant_name in plant_list:
+        technology = technology_choices[plant_name]
+        if technology not in technology_rates:
+            technology_rates[technology] = sum(
+                business_case_ref[(technology, material)] for material in materials
+            )
+        usage_sum += technology_rates[technology] * (
+            capacities_dict[plant_name]
+            * CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION
+        )
+    return usage_sum
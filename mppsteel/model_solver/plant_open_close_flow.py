@@ -222,6 +222,9 @@ def close_real_plants(
     investment_dict = investment_container.return_investment_dict()
     plant_start_years = investment_container.plant_start_years
     plant_cycle_lengths = investment_container.return_cycle_lengths()
+    # The choice records are not appended to within this function, so the
+    # records frame is built once rather than per closed plant.
+    choice_records = tech_choices_container.output_records_to_df("choice")
     active_steel_plants_df = steel_plant_df[
         steel_plant_df["active_check"] == True
     ].copy()
@@ -261,7 +264,7 @@ def close_real_plants(
             while capacity_removed <= min_capacity_to_close:
                 plant_to_close = return_oldest_plant(
                     investment_dict,
-                    tech_choices_container.output_records_to_df("choice"),
+                    choice_records,
                     plant_start_years,
                     plant_cycle_lengths,
                     year,
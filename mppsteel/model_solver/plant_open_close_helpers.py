@@ -177,14 +177,14 @@ def get_min_cost_region(lcost_df: pd.DataFrame, year: int) -> str:
 
 
 def check_year_range_for_switch_type(
-    tech_choices_dict: pd.DataFrame,
-    plant_name: str,
+    plant_tech_choices: Union[pd.DataFrame, None],
     list_with_years: list,
     switch_type: str,
 ) -> Union[None, range]:
-    df_c = tech_choices_dict[tech_choices_dict["plant_name"] == plant_name].copy()
-    if list_with_years:
-        check_df = df_c[df_c["year"].isin(list_with_years)].copy()
+    if (plant_tech_choices is not None) and list_with_years:
+        check_df = plant_tech_choices[
+            plant_tech_choices["year"].isin(list_with_years)
+        ]
         if switch_type in check_df.switch_type.unique():
             return check_df[check_df["switch_type"] == switch_type]["year"]
     return None
@@ -208,12 +208,11 @@ def get_closest_year_main_switch(
 
 
 def get_closest_year_trans_switch(
-    list_of_ranges, tech_choices_dict, year_to_check, plant_name
+    list_of_ranges, plant_tech_choices, year_to_check
 ) -> Union[None, range]:
     list_with_years = get_trans_switch_range(list_of_ranges, year_to_check)
     return check_year_range_for_switch_type(
-        tech_choices_dict,
-        plant_name,
+        plant_tech_choices,
         list_with_years,
         "Transitional switch in off-cycle investment year",
     )
@@ -221,7 +220,7 @@ def get_closest_year_trans_switch(
 
 def current_plant_year(
     investment_dict: pd.DataFrame,
-    tech_choices_dict: pd.DataFrame,
+    plant_tech_choices: Union[pd.DataFrame, None],
     plant_start_years: dict,
     plant_cycle_lengths: dict,
     plant_name: str,
@@ -231,6 +230,7 @@ def current_plant_year(
 
     Args:
         investment_dict (pd.DataFrame): Dictionary with plant names as keys and main investment cycles as values.
+        plant_tech_choices (pd.DataFrame): The technology choice records for this plant only, or None if there are none.
         plant_name (str): The name of the plant.
         current_year (int): The current model cycle year.
 
@@ -244,7 +244,7 @@ def current_plant_year(
     trans_years = [yr for yr in investment_dict[plant_name] if isinstance(yr, range)]
     main_switch_year = get_closest_year_main_switch(main_cycle_years, current_year)
     trans_switch_year = get_closest_year_trans_switch(
-        trans_years, tech_choices_dict, current_year, plant_name
+        trans_years, plant_tech_choices, current_year
     )
     potential_investment_years = [
         num for num in [main_switch_year, trans_switch_year] if isinstance(num, int)
@@ -341,10 +341,16 @@ def return_oldest_plant(
     """
     if not plant_list:
         plant_list = list(investment_dict.keys())
+    # Group the choice records once: a boolean scan of the full records frame
+    # per plant would make this quadratic in the number of plants.
+    choices_by_plant = {
+        plant_name: group
+        for plant_name, group in tech_choices_dict.groupby("plant_name")
+    }
     plant_age_dict = {
         plant_name: current_plant_year(
             investment_dict,
-            tech_choices_dict,
+            choices_by_plant.get(plant_name),
             plant_start_years,
             plant_cycle_lengths,
             plant_name,
@@ -458,7 +464,7 @@ def production_demand_gap(
         bounded_utilization = utilization_boundary(
             initial_utilization, util_min, util_max
         )
-        avg_plant_capacity_value = deepcopy(avg_plant_global_capacity)
+        avg_plant_capacity_value = avg_plant_global_capacity
 
         avg_plant_capacity_at_max_production = avg_plant_capacity_value * util_max
 
@@ -475,7 +481,7 @@ def production_demand_gap(
             cases[region].append(
                 "INCREASE CAPACITY: Capacity can be adjusted to meet demand"
             )
-            new_total_capacity = deepcopy(capacity)
+            new_total_capacity = capacity
             new_min_utilization_required = demand / capacity
 
         elif initial_min_utilization_reqiured < util_min:
@@ -58,6 +58,7 @@ from mppsteel.model_solver.material_usage_class import (
 from mppsteel.model_solver.plant_open_close_flow import open_close_plants
 from mppsteel.model_solver.solver_flow_helpers import (
     active_check_results,
+    build_tech_availability_ref,
     create_solver_entry_dict,
     get_current_technology,
     resort_primary_switchers,
@@ -188,6 +189,9 @@ class ChooseTechnologyInput:
 
     @classmethod
     def from_filesystem(cls, scenario_dict, pkl_paths, year_range=MODEL_YEAR_RANGE):
+        # Every pickle the solver needs is loaded here, once, before the year
+        # loop in choose_technology_core. Keep it that way: the loaded data is
+        # year-invariant and re-reading it inside the loop is a hot-path cost.
         tech_moratorium = scenario_dict["tech_moratorium"]
         trade_active = scenario_dict["trade_active"]
         enforce_constraints = scenario_dict["enforce_constraints"]
@@ -251,9 +255,7 @@ class ChooseTechnologyInput:
         levelized_cost = read_pickle_folder(
             PROJECT_PATH / intermediate_path, "levelized_cost_standardized", "df"
         )
-        levelized_cost["region"] = levelized_cost["country_code"].apply(
-            lambda x: rmi_mapper[x]
-        )
+        levelized_cost["region"] = levelized_cost["country_code"].map(rmi_mapper)
         steel_plant_abatement_switches = read_pickle_folder(
             PROJECT_PATH / intermediate_path, "emissivity_abatement_switches", "df"
         )
@@ -340,6 +342,16 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
     wsa_dict = cti.wsa_dict
     model_year_range: range = cti.model_year_range
 
+    # Technology availability only depends on (year, technology), so it is
+    # resolved once for the full model horizon rather than per best-tech call.
+    tech_availability_ref = (
+        build_tech_availability_ref(
+            tech_availability, model_year_range, tech_moratorium
+        )
+        if not tech_availability.empty
+        else {}
+    )
+
     # Initialize plant container
     PlantIDC = PlantIdContainer()
     PlantIDC.add_steel_plant_ids(original_plant_df)
@@ -422,20 +434,22 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
                     year, row.plant_name, row.initial_technology
                 )
 
-        all_active_plant_names = active_plant_df["plant_name"].copy()
+        all_active_plant_names = active_plant_df["plant_name"].to_list()
         plant_capacities_dict = CapacityContainer.return_plant_capacity(year=year)
         switchers = PlantInvestmentCycleContainer.return_plant_switchers(
             all_active_plant_names, year, "combined"
         )
-        non_switchers = list(set(all_active_plant_names).difference(switchers))
-        switchers_df = (
-            active_plant_df.set_index(["plant_name"]).drop(non_switchers).reset_index()
-        ).copy()
-        switchers_df.rename({"index": "plant_name"}, axis=1, inplace=True)
+        switchers_set = set(switchers)
+        non_switchers = [
+            plant_name
+            for plant_name in all_active_plant_names
+            if plant_name not in switchers_set
+        ]
+        switchers_mask = active_plant_df["plant_name"].isin(switchers_set)
+        switchers_df = active_plant_df[switchers_mask].reset_index(drop=True).copy()
         non_switchers_df = (
-            active_plant_df.set_index(["plant_name"]).drop(switchers).reset_index()
-        ).copy()
-        non_switchers_df.rename({"index": "plant_name"}, axis=1, inplace=True)
+            active_plant_df[~switchers_mask].reset_index(drop=True).copy()
+        )
         logger.info(f"-- Assigning usage for exisiting plants")
 
         # skip first year
@@ -581,18 +595,18 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
             ].copy()
             all_active_plant_names = capacity_adjusted_active_plants[
                 "plant_name"
-            ].copy()
+            ].to_list()
             plant_capacities_dict = CapacityContainer.return_plant_capacity(year=year)
             switchers = PlantInvestmentCycleContainer.return_plant_switchers(
                 all_active_plant_names, year, "combined"
             )
-            non_switchers = list(set(all_active_plant_names).difference(switchers))
             switchers_df = (
-                capacity_adjusted_active_plants.set_index(["plant_name"])
-                .drop(non_switchers)
-                .reset_index()
-            ).copy()
-            switchers_df.rename({"index": "plant_name"}, axis=1, inplace=True)
+                capacity_adjusted_active_plants[
+                    capacity_adjusted_active_plants["plant_name"].isin(set(switchers))
+                ]
+                .reset_index(drop=True)
+                .copy()
+            )
             switchers_df = switchers_df.sample(frac=1)
             logger.info(f"-- Running investment decisions for Non Switching Plants")
 
@@ -657,66 +671,25 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
                     update_choice=True,
                 )
 
-            # CASE 3: MAIN CYCLE PLANTS
-            for plant_name in tqdm(
-                main_cycle_plants,
-                total=len(main_cycle_plants),
-                desc="Main Cycle Plants",
-            ):
-                current_tech = main_cycle_plants[plant_name]["current_tech"]
-                best_choice_tech = return_best_tech(
-                    tco_reference_data=tco_slim,
-                    abatement_reference_data=abatement_slim,
-                    business_case_ref=business_case_ref,
-                    variable_costs_df=variable_costs_regional,
-                    green_premium_timeseries=green_premium_timeseries,
-                    tech_availability=tech_availability,
-                    tech_avail_from_dict=ta_dict,
-                    plant_capacities=plant_capacities_dict,
-                    scenario_dict=scenario_dict,
-                    investment_container=PlantInvestmentCycleContainer,
-                    plant_choice_container=PlantChoiceContainer,
-                    capacity_constraint_container=PlantCapacityConstraintContainer,
-                    year=year,
-                    plant_name=plant_name,
-                    region=main_cycle_plants[plant_name]["region"],
-                    country_code=main_cycle_plants[plant_name]["country_code"],
-                    base_tech=current_tech,
-                    transitional_switch_mode=False,
-                    material_usage_dict_container=MaterialUsageContainer,
-                )
-                switch_type_entry = (
-                    "No change in main investment cycle year"
-                    if best_choice_tech == current_tech
-                    else "Regular change in investment cycle year"
-                )
-
-                create_solver_entry_dict(
-                    PlantChoiceContainer,
-                    year,
-                    plant_name,
-                    current_tech,
-                    best_choice_tech,
-                    switch_type_entry,
-                    update_record=True,
-                    update_choice=True,
-                )
-
-            # CASE 4: TRANSITIONARY SWITCH PLANTS
+            # CASES 3 & 4: MAIN CYCLE AND TRANSITIONARY SWITCH PLANTS
+            # The two cases share a single return_best_tech call site and only
+            # differ in the transitional switch flag and record bookkeeping.
+            switch_groups = [("Main Cycle Plants", main_cycle_plants, False)]
             if scenario_dict["transitional_switch"]:
+                switch_groups.append(("Trans Switch Plants", trans_switch_plants, True))
+
+            for desc, switch_plants, transitional_switch_mode in switch_groups:
                 for plant_name in tqdm(
-                    trans_switch_plants,
-                    total=len(trans_switch_plants),
-                    desc="Trans Switch Plants",
+                    switch_plants, total=len(switch_plants), desc=desc
                 ):
-                    current_tech = trans_switch_plants[plant_name]["current_tech"]
+                    current_tech = switch_plants[plant_name]["current_tech"]
                     best_choice_tech = return_best_tech(
                         tco_reference_data=tco_slim,
                         abatement_reference_data=abatement_slim,
                         business_case_ref=business_case_ref,
                         variable_costs_df=variable_costs_regional,
                         green_premium_timeseries=green_premium_timeseries,
-                        tech_availability=tech_availability,
+                        tech_availability_ref=tech_availability_ref,
                         tech_avail_from_dict=ta_dict,
                         plant_capacities=plant_capacities_dict,
                         scenario_dict=scenario_dict,
@@ -725,21 +698,29 @@ def choose_technology_core(cti: ChooseTechnologyInput) -> dict:
                         capacity_constraint_container=PlantCapacityConstraintContainer,
                         year=year,
                         plant_name=plant_name,
-                        region=trans_switch_plants[plant_name]["region"],
-                        country_code=trans_switch_plants[plant_name]["country_code"],
+                        region=switch_plants[plant_name]["region"],
+                        country_code=switch_plants[plant_name]["country_code"],
                         base_tech=current_tech,
-                        transitional_switch_mode=True,
+                        transitional_switch_mode=transitional_switch_mode,
                         material_usage_dict_container=MaterialUsageContainer,
                     )
-                    if best_choice_tech != current_tech:
-                        PlantInvestmentCycleContainer.adjust_cycle_for_transitional_switch(
-                            plant_name, year
+                    if transitional_switch_mode:
+                        if best_choice_tech != current_tech:
+                            PlantInvestmentCycleContainer.adjust_cycle_for_transitional_switch(
+                                plant_name, year
+                            )
+                        switch_type_entry = (
+                            "Transitional switch in off-cycle investment year"
+                            if best_choice_tech != current_tech
+                            else "No change during off-cycle investment year"
                         )
-                    switch_type_entry = (
-                        "Transitional switch in off-cycle investment year"
-                        if best_choice_tech != current_tech
-                        else "No change during off-cycle investment year"
-                    )
+                    else:
+                        switch_type_entry = (
+                            "No change in main investment cycle year"
+                            if best_choice_tech == current_tech
+                            else "Regular change in investment cycle year"
+                        )
+
                     create_solver_entry_dict(
                         PlantChoiceContainer,
                         year,
@@ -873,9 +854,7 @@ def create_levelized_cost_actuals(
         capacity_dict=results_dict["plant_capacity_results"],
         active_check_results_dict=results_dict["active_check_results_dict"],
     )
-    tech_capacity_df["region"] = tech_capacity_df["country_code"].apply(
-        lambda x: rmi_mapper[x]
-    )
+    tech_capacity_df["region"] = tech_capacity_df["country_code"].map(rmi_mapper)
     tech_capacity_df["cuf"] = tech_capacity_df.apply(
         utilization_mapper,
         utilization_results=results_dict["utilization_results"],
@@ -17,7 +17,6 @@ from mppsteel.config.model_config import (
 from mppsteel.config.model_scenarios import TECH_SWITCH_SCENARIOS, SOLVER_LOGICS
 from mppsteel.config.reference_lists import (
     SWITCH_DICT,
-    TECH_REFERENCE_LIST,
     TECHNOLOGY_PHASES,
     FURNACE_GROUP_DICT,
 )
@@ -35,6 +34,17 @@ from mppsteel.utility.log_utility import get_logger
 
 logger = get_logger(__name__)
 
+# The valid switch and furnace group references are static, so they are
+# resolved once at import time rather than on every best-tech call.
+VALID_SWITCHES_REF: Dict[str, List[str]] = {
+    base_tech: [tech for tech in SWITCH_DICT if tech in SWITCH_DICT[base_tech]]
+    for base_tech in SWITCH_DICT
+}
+FURNACE_GROUP_SETS_REF: Dict[str, set] = {
+    base_tech: set(return_furnace_group(FURNACE_GROUP_DICT, base_tech))
+    for base_tech in SWITCH_DICT
+}
+
 
 def return_best_tech(
     tco_reference_data: pd.DataFrame,
@@ -42,7 +52,7 @@ def return_best_tech(
     business_case_ref: dict,
     variable_costs_df: pd.DataFrame,
     green_premium_timeseries: pd.DataFrame,
-    tech_availability: pd.DataFrame,
+    tech_availability_ref: Dict[Tuple[int, str], bool],
     tech_avail_from_dict: dict,
     plant_capacities: dict,
     scenario_dict: MYPY_SCENARIO_TYPE,
@@ -65,7 +75,7 @@ def return_best_tech(
         business_case_ref (dict): Standardised Business Cases.
         variable_costs_df (pd.DataFrame): Variable Costs DataFrame.
         green_premium_timeseries (pd.DataFrame): The timeseries containing the green premium values.
-        tech_availability (pd.DataFrame): Technology Availability DataFrame
+        tech_availability_ref (dict): Precomputed availability booleans keyed on (year, technology).
         tech_avail_from_dict (dict): A condensed version of the technology availability DataFrame as a dictionary of technology as key, availability year as value.
         plant_capacities (dict): A dictionary containing plant: capacity/inital tech key:value pairs.
         scenario_dict (dict): Scenario dictionary containing the model run's scenario settings.
@@ -87,13 +97,27 @@ def return_best_tech(
     """
     proportions_dict = TECH_SWITCH_SCENARIOS[str(scenario_dict["tech_switch_scenario"])]
     solver_logic = SOLVER_LOGICS[str(scenario_dict["solver_logic"])]
-    tech_moratorium = bool(scenario_dict["tech_moratorium"])
     enforce_constraints = bool(scenario_dict["enforce_constraints"])
     green_premium_scenario = str(scenario_dict["green_premium_scenario"])
     scenario_name = str(scenario_dict["scenario_name"])
     regional_scrap = bool(scenario_dict["regional_scrap_constraint"])
 
-    tco_ref_data = tco_reference_data.copy()
+    if not base_tech:
+        raise ValueError(
+            f"Issue with base_tech not existing: {plant_name} | {year} | {base_tech}"
+        )
+
+    if not isinstance(base_tech, str):
+        raise ValueError(
+            f"Issue with base_tech not being a string: {plant_name} | {year} | {base_tech}"
+        )
+
+    # Only the (year, country_code, base_tech) cross-section is read by the
+    # ranking logic, so slice it out once instead of copying the full
+    # reference frames on every call.
+    reference_key = (year, country_code, base_tech)
+    tco_ref_data = tco_reference_data.loc[[reference_key]].copy()
+    abatement_ref_data = abatement_reference_data.loc[[reference_key]]
 
     ## ## RECCOMMENDED TO RUN MODEL WITH green_premium_scenario SWITCHED OFF AS THIS FEATURE IS NOT FULLY TESTED.
     if green_premium_scenario != "off":
@@ -108,29 +132,13 @@ def return_best_tech(
             year,
             usd_to_eur_rate,
         )
-        for technology in TECH_REFERENCE_LIST:
-            for tco_col in ["tco_regular_capex", "tco_gf_capex"]:
-                current_tco_value = tco_ref_data.loc[
-                    (year, country_code, technology), tco_col
-                ]
-                tco_ref_data.loc[(year, country_code, technology), tco_col] = (
-                    current_tco_value - discounted_green_premium_values[technology]
-                )
-
-    if not base_tech:
-        raise ValueError(
-            f"Issue with base_tech not existing: {plant_name} | {year} | {base_tech}"
-        )
-
-    if not isinstance(base_tech, str):
-        raise ValueError(
-            f"Issue with base_tech not being a string: {plant_name} | {year} | {base_tech}"
-        )
+        for tco_col in ["tco_regular_capex", "tco_gf_capex"]:
+            tco_ref_data[tco_col] = (
+                tco_ref_data[tco_col] - discounted_green_premium_values[base_tech]
+            )
 
     # Valid Switches
-    combined_available_list: List[str] = [
-        tech for tech in SWITCH_DICT if tech in SWITCH_DICT[base_tech]
-    ]
+    combined_available_list: List[str] = list(VALID_SWITCHES_REF[base_tech])
 
     # Transitional switches
     if transitional_switch_mode and (base_tech not in TECHNOLOGY_PHASES["end_state"]):
@@ -139,17 +147,13 @@ def return_best_tech(
         # Must be within the furnace group
         combined_available_list = list(
             set(combined_available_list).intersection(
-                set(return_furnace_group(FURNACE_GROUP_DICT, base_tech))
+                FURNACE_GROUP_SETS_REF[base_tech]
             )
         )
 
     # Availability checks
     combined_available_list = [
-        tech
-        for tech in combined_available_list
-        if tech_availability_check(
-            tech_availability, tech, year, tech_moratorium=tech_moratorium
-        )
+        tech for tech in combined_available_list if tech_availability_ref[(year, tech)]
     ]
 
     # Add base tech if the technology is technically unavailable but is already in use
@@ -172,7 +176,7 @@ def return_best_tech(
 
     best_choice = get_best_choice(
         tco_ref_data,
-        abatement_reference_data,
+        abatement_ref_data,
         country_code,
         year,
         base_tech,
@@ -335,33 +339,48 @@ def split_primary_plant_switchers(
     new_open_plants = {}
     main_cycle_plants = {}
     trans_switch_plants = {}
-    for row in primary_switchers_df.itertuples():
-        year_founded = PlantInvestmentCycleContainer.plant_start_years[row.plant_name]
+    # Only five columns are read per row, so the iteration is restricted to
+    # them and unpacked as plain tuples rather than full-width namedtuples.
+    switcher_columns = [
+        "plant_name",
+        "initial_technology",
+        "status",
+        "country_code",
+        "rmi_region",
+    ]
+    for (
+        plant_name,
+        initial_technology,
+        status,
+        country_code,
+        rmi_region,
+    ) in primary_switchers_df[switcher_columns].itertuples(index=False, name=None):
+        year_founded = PlantInvestmentCycleContainer.plant_start_years[plant_name]
         switch_type = PlantInvestmentCycleContainer.return_plant_switch_type(
-            row.plant_name, year
+            plant_name, year
         )
         current_tech = get_current_technology(
             PlantChoiceContainer,
             year,
-            row.plant_name,
+            plant_name,
             year_founded,
-            row.initial_technology,
+            initial_technology,
         )
         if current_tech == "Close plant":
-            closed_plants_current_techs[row.plant_name] = current_tech
-        elif (year == year_founded) and (row.status == "new model plant"):
-            new_open_plants[row.plant_name] = current_tech
+            closed_plants_current_techs[plant_name] = current_tech
+        elif (year == year_founded) and (status == "new model plant"):
+            new_open_plants[plant_name] = current_tech
         elif switch_type == "main cycle":
-            main_cycle_plants[row.plant_name] = {
+            main_cycle_plants[plant_name] = {
                 "current_tech": current_tech,
-                "country_code": row.country_code,
-                "region": row.rmi_region,
+                "country_code": country_code,
+                "region": rmi_region,
             }
         elif switch_type == "trans switch":
-            trans_switch_plants[row.plant_name] = {
+            trans_switch_plants[plant_name] = {
                 "current_tech": current_tech,
-                "country_code": row.country_code,
-                "region": row.rmi_region,
+                "country_code": country_code,
+                "region": rmi_region,
             }
     return (
         closed_plants_current_techs,
@@ -415,6 +434,28 @@ def read_and_format_tech_availability(df: pd.DataFrame) -> pd.DataFrame:
     return df_c[col_order].set_index("technology")
 
 
+def build_tech_availability_ref(
+    tech_availability: pd.DataFrame, year_range: range, tech_moratorium: bool
+) -> Dict[Tuple[int, str], bool]:
+    """Precomputes the availability of each technology for each model year.
+
+    Args:
+        tech_availability (pd.DataFrame): The technology availability DataFrame.
+        year_range (range): The model year range to compute the availability for.
+        tech_moratorium (bool): Boolean flag that determines if the tech moratorium is active.
+
+    Returns:
+        dict: A dictionary with (year, technology) keys and availability booleans as values.
+    """
+    return {
+        (year, technology): tech_availability_check(
+            tech_availability, technology, year, tech_moratorium=tech_moratorium
+        )
+        for year in year_range
+        for technology in SWITCH_DICT
+    }
+
+
 def tech_availability_check(
     tech_df: pd.DataFrame,
     technology: str,
@@ -1,6 +1,4 @@
 """Script for the tco and abatament optimisation functions."""
-from copy import deepcopy
-from functools import lru_cache
 import random
 from typing import Tuple
 
@@ -21,11 +19,13 @@ from mppsteel.utility.utils import (
 from mppsteel.utility.dataframe_utility import change_cols_to_numeric
 
 from mppsteel.config.model_config import (
+    CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION,
     TCO_RANK_1_SCALER,
     TCO_RANK_2_SCALER,
     ABATEMENT_RANK_2,
     ABATEMENT_RANK_3,
 )
+from mppsteel.config.reference_lists import RESOURCE_CONTAINER_REF
 
 
 logger = get_logger(__name__)
@@ -53,48 +53,47 @@ def scale_data(df: pd.DataFrame, reverse: bool = False) -> np.ndarray:
     Returns:
         np.ndarray: An array with the same shape as the input dataframe, but with values scaled between 0 and 1.
     """
-    df_c = df.copy()
+    # normalising reads the underlying values without mutating them, so no copy is needed
     if reverse:
-        return 1 - normalise_data(df_c.values)
-    return normalise_data(df_c.values)
+        return 1 - normalise_data(df.values)
+    return normalise_data(df.values)
+
 
+def tco_ranker_logic(values: np.ndarray, ref_value: float) -> np.ndarray:
+    """Ranks an array of TCO values against a reference value.
 
-@lru_cache(maxsize=250000)
-def tco_ranker_logic(x: float, ref_value: float) -> int:
-    """If the value is greater than the minimum value times a scaler, return a rank of 3. If the value is
-    greater than the minimum value times another scaler, return a rank of 2. Otherwise, return a rank of 1.
+    Values above the reference times the rank 2 scaler get a rank of 3, values
+    above the reference times the rank 1 scaler get a rank of 2, and all other
+    values get a rank of 1.
 
     Args:
-        x (float): The value to be ranked.
+        values (np.ndarray): The values to be ranked.
         ref_value (float): The minimum value of the metric.
 
     Returns:
-        int: A number between 1 and 3.
+        np.ndarray: An array of ranks between 1 and 3.
     """
-    if x > ref_value * TCO_RANK_2_SCALER:
-        return 3
-    elif x > ref_value * TCO_RANK_1_SCALER:
-        return 2
-    return 1
+    return np.where(
+        values > ref_value * TCO_RANK_2_SCALER,
+        3,
+        np.where(values > ref_value * TCO_RANK_1_SCALER, 2, 1),
+    )
 
 
-@lru_cache(maxsize=250000)
-def abatement_ranker_logic(x: float) -> int:
-    """Given a value, return a rank.
+def abatement_ranker_logic(values: np.ndarray) -> np.ndarray:
+    """Ranks an array of emissions abatement values against the abatement rank boundaries.
 
     Args:
-        x (float): The value of the parameter to be ranked.
+        values (np.ndarray): The values to be ranked.
 
     Returns:
-        int: The abatement rank for each row.
+        np.ndarray: An array of ranks between 1 and 3.
     """
-
-    if x < ABATEMENT_RANK_3:
-        return 3
-    elif x < ABATEMENT_RANK_2:
-        return 2
-    else:
-        return 1
+    return np.where(
+        values < ABATEMENT_RANK_3,
+        3,
+        np.where(values < ABATEMENT_RANK_2, 2, 1),
+    )
 
 
 def min_ranker(
@@ -124,16 +123,18 @@ def min_ranker(
     Returns:
         Tuple[pd.DataFrame, str]: A DataFrame containing the sorted list of each technology for a given plant and technology.
     """
-    # subsetting the dataframe
-    df_c = df.loc[year, country_code, start_tech].copy()
+    # subsetting the dataframe; the boolean subset below takes its own copy
+    df_c = df.loc[year, country_code, start_tech]
     # subset switch_technology based on technology_list
     if transitional_switch_mode and start_tech not in technology_list:
         technology_list.append(start_tech)
     df_subset = df_c[df_c["switch_tech"].isin(technology_list)].copy()
     # set index as switch_tech
     df_subset = df_subset.reset_index().set_index("switch_tech")
-    # sort the dataframe according to the value column
-    df_subset.sort_values(value_col, ascending=True, inplace=True)
+    if rank:
+        # only the ranking path consumes sorted rows; the scaled path scales
+        # and joins by index, so sorting there would be wasted work
+        df_subset.sort_values(value_col, ascending=True, inplace=True)
     # default ref: empty string
     tco_reference_tech = ""
     data_type_col_mapper = {
@@ -162,12 +163,12 @@ def min_ranker(
                 # identify the minimum value
                 tco_reference_tech = df_subset[value_col].idxmin()
                 ref_val = df_subset[value_col].min()
-            df_subset[data_type_col_mapper[data_type]] = df_subset[value_col].apply(
-                lambda x: tco_ranker_logic(x, ref_val)
+            df_subset[data_type_col_mapper[data_type]] = tco_ranker_logic(
+                df_subset[value_col].to_numpy(), ref_val
             )
         elif data_type == "abatement":
-            df_subset[data_type_col_mapper[data_type]] = df_subset[value_col].apply(
-                lambda x: abatement_ranker_logic(x)
+            df_subset[data_type_col_mapper[data_type]] = abatement_ranker_logic(
+                df_subset[value_col].to_numpy()
             )
 
     return df_subset, tco_reference_tech
@@ -344,7 +345,7 @@ def return_best_choice(
         return random.choice(potential_techs)
     # pick the only option if there is one option
     elif len(best_values) == 1:
-        return best_values.index.values[0]
+        return best_values.index[0]
     # pick initial tech if there are no options
     elif len(best_values) == 0:
         # print(F"**** NO BEST CHOICES!!! REVERTING TO {start_tech} *****")
@@ -428,7 +429,7 @@ def get_best_choice(
                 override_constraint=False,
                 apply_transaction=False,
             )
-            updated_tech_availability = deepcopy(constraint_included_techs)
+            updated_tech_availability = list(constraint_included_techs)
 
             if transitional_switch_mode and start_tech not in updated_tech_availability:
                 updated_tech_availability.append(start_tech)
@@ -441,30 +442,25 @@ def get_best_choice(
             return_tech = start_tech
         else:
             # Scale the data
-            tco_values_scaled = tco_values.copy()
-
             if solver_logic == "scaled":
-                tco_values_scaled["tco_scaled"] = scale_data(
-                    tco_values_scaled[cost_value_col]
+                # build the single-column frames directly rather than copying the
+                # full frames and dropping every other column afterwards
+                tco_values_scaled = pd.DataFrame(
+                    {"tco_scaled": scale_data(tco_values[cost_value_col])},
+                    index=tco_values.index,
                 )
-                tco_values_scaled.drop(
-                    columns=tco_values_scaled.columns.difference(["tco_scaled"]),
-                    axis=1,
-                    inplace=True,
-                )
-                abatement_values_scaled = abatement_values.copy()
-                abatement_values_scaled["abatement_scaled"] = scale_data(
-                    abatement_values_scaled["abated_combined_emissivity"], reverse=True
-                )
-                abatement_values_scaled.drop(
-                    columns=abatement_values_scaled.columns.difference(
-                        ["abatement_scaled"]
-                    ),
-                    axis=1,
-                    inplace=True,
+                abatement_values_scaled = pd.DataFrame(
+                    {
+                        "abatement_scaled": scale_data(
+                            abatement_values["abated_combined_emissivity"],
+                            reverse=True,
+                        )
+                    },
+                    index=abatement_values.index,
                 )
 
             elif solver_logic == "scaled_bins":
+                tco_values_scaled = tco_values.copy()
                 binned_rank_dict = create_bin_rank_dict(
                     tco_values_scaled[cost_value_col],
                     number_of_items=len(technology_list),
@@ -497,8 +493,11 @@ def get_best_choice(
             # Join the abatement and tco data and calculate an overall score using the weightings
             combined_scales = tco_values_scaled.join(abatement_values_scaled)
             combined_scales["overall_score"] = (
-                combined_scales["tco_scaled"] * weighting_dict["tco"]
-            ) + (combined_scales["abatement_scaled"] * weighting_dict["emissions"])
+                combined_scales["tco_scaled"].to_numpy() * weighting_dict["tco"]
+            ) + (
+                combined_scales["abatement_scaled"].to_numpy()
+                * weighting_dict["emissions"]
+            )
             record_ranking(
                 combined_scales,
                 technology_list,
@@ -514,16 +513,17 @@ def get_best_choice(
                 scenario_name,
                 transitional_switch_mode,
             )
-            combined_scales.drop(
-                labels=combined_scales.index.difference(updated_tech_availability),
-                inplace=True,
-            )
-            combined_scales.sort_values("overall_score", axis=0, inplace=True)
+            # single isin mask instead of building an index difference and dropping it
+            combined_scales = combined_scales[
+                combined_scales.index.isin(updated_tech_availability)
+            ]
 
             if solver_logic == "scaled":
-                return_tech = combined_scales.idxmin()["overall_score"]
+                # a single idxmin scan replaces sorting the whole frame
+                return_tech = combined_scales["overall_score"].idxmin()
 
             elif solver_logic == "scaled_bins":
+                combined_scales.sort_values("overall_score", axis=0, inplace=True)
                 min_value = combined_scales["overall_score"].min()
                 best_values = combined_scales[
                     combined_scales["overall_rank"] == min_value
@@ -562,7 +562,7 @@ def get_best_choice(
                 override_constraint=False,
                 apply_transaction=False,
             )
-            updated_tech_availability = deepcopy(constraint_included_techs)
+            updated_tech_availability = list(constraint_included_techs)
             if transitional_switch_mode and start_tech not in updated_tech_availability:
                 updated_tech_availability.append(start_tech)
 
@@ -604,10 +604,9 @@ def get_best_choice(
             scenario_name,
             transitional_switch_mode,
         )
-        combined_ranks.drop(
-            labels=combined_ranks.index.difference(updated_tech_availability),
-            inplace=True,
-        )
+        combined_ranks = combined_ranks[
+            combined_ranks.index.isin(updated_tech_availability)
+        ]
         combined_ranks.sort_values("overall_rank", axis=0, inplace=True)
         min_value = combined_ranks["overall_rank"].min()
         best_values = combined_ranks[combined_ranks["overall_rank"] == min_value]
@@ -678,19 +677,62 @@ def apply_constraints(
 ):
     # Constraints checks
     new_availability_list = []
-    for switch_technology in combined_available_list:
-        material_check_container = create_material_usage_dict(
-            material_usage_dict_container,
-            plant_capacities,
-            business_case_ref,
-            plant_name,
-            region,
-            year,
-            switch_technology,
-            regional_scrap,
-            override_constraint=override_constraint,
-            apply_transaction=apply_transaction,
+    resources = list(RESOURCE_CONTAINER_REF)
+    if override_constraint or apply_transaction:
+        material_check_containers = [
+            create_material_usage_dict(
+                material_usage_dict_container,
+                plant_capacities,
+                business_case_ref,
+                plant_name,
+                region,
+                year,
+                switch_technology,
+                regional_scrap,
+                override_constraint=override_constraint,
+                apply_transaction=apply_transaction,
+            )
+            for switch_technology in combined_available_list
+        ]
+    else:
+        # Check-only mode: the balances cannot change between candidate
+        # technologies, so the projected usage for every (technology, resource)
+        # pair is computed as one matrix and compared against the budgets in a
+        # single pass instead of one constraint transaction per pair.
+        capacity_utilized = (
+            plant_capacities[plant_name]
+            * CAPACITY_UTILIZATION_CUTOFF_FOR_NEW_PLANT_DECISION
+        )
+        # the explicit 2-D shape keeps the budget comparison broadcastable
+        # when there are no candidate technologies
+        usage_matrix = capacity_utilized * np.array(
+            [
+                [
+                    sum(
+                        business_case_ref[(switch_technology, material)]
+                        for material in RESOURCE_CONTAINER_REF[resource]
+                    )
+                    for resource in resources
+                ]
+                for switch_technology in combined_available_list
+            ]
+        ).reshape(-1, len(resources))
+        budgets = np.array(
+            [
+                material_usage_dict_container.get_current_balance(
+                    year, resource, region=region if regional_scrap else ""
+                )
+                for resource in resources
+            ]
         )
+        pass_matrix = (usage_matrix <= 0) | (usage_matrix <= budgets)
+        material_check_containers = [
+            dict(zip(resources, map(bool, pass_row))) for pass_row in pass_matrix
+        ]
+
+    for switch_technology, material_check_container in zip(
+        combined_available_list, material_check_containers
+    ):
         if all(material_check_container.values()):
             new_availability_list.append(switch_technology)
         failure_resources = [
@@ -159,25 +159,10 @@ def create_annual_capacity_dict(
     Returns:
         Tuple[dict, dict]: A tuple of the two capacity dictionary references.
     """
-    regions = plant_df[MAIN_REGIONAL_SCHEMA].unique()
     plant_capacity_dict = dict(zip(plant_df["plant_name"], plant_df["plant_capacity"]))
-    regional_capacity_dict_list = {
-        region: [
-            plant_capacity_dict[plant_name]
-            for plant_name in set(plant_capacity_dict.keys()).intersection(
-                set(
-                    plant_df[plant_df[MAIN_REGIONAL_SCHEMA] == region][
-                        "plant_name"
-                    ].unique()
-                )
-            )
-        ]
-        for region in regions
-    }
-    regional_capacity_dict = {
-        region: sum(value_list)
-        for region, value_list in regional_capacity_dict_list.items()
-    }
+    regional_capacity_dict = (
+        plant_df.groupby(MAIN_REGIONAL_SCHEMA)["plant_capacity"].sum().to_dict()
+    )
     if as_mt:
         plant_capacity_dict = {
             plant_name: value / MEGATON_TO_KILOTON_FACTOR
@@ -7,6 +7,14 @@ from mppsteel.utility.log_utility import get_logger
 
 logger = get_logger(__name__)
 
+CHOICE_RECORD_COLUMNS = [
+    "year",
+    "plant_name",
+    "current_tech",
+    "switch_tech",
+    "switch_type",
+]
+
 
 class PlantChoices:
     """Description
@@ -14,14 +22,14 @@ class PlantChoices:
 
     Main Class attributes
         choices: Keeps track of each plants choice in every year. A dictionary in the form [year][plant_name] -> technology
-        choice_records: A list of DataFrames that record why certain technologies were chosen or not chosen. The list can be outputted to a combined DataFrame.
+        choice_records: Columnar buffers that record why certain technologies were chosen or not chosen. The buffers can be outputted to a combined DataFrame.
         rank_records: A list of DataFrames that record the rankings of technologies prior to the selection. The list can be outputted to a combined DataFrame.
         active_check: A dictionary that keeps track of whether a plant is active or not. A dictionary in the form [year][plant_name] -> boolean check
     """
 
     def __init__(self):
         self.choices = {}
-        self.choice_records = []
+        self.choice_records = {column: [] for column in CHOICE_RECORD_COLUMNS}
         self.rank_records = []
         self.active_check = {}
 
@@ -51,15 +59,18 @@ class PlantChoices:
             plant for plant in self.choices[year] if pd.isna(self.choices[year][plant])
         ]
 
-    def update_records(self, record_type: str, df_entry: pd.DataFrame):
+    def update_records(self, record_type: str, df_entry):
         if record_type == "choice":
-            self.choice_records.append(df_entry)
+            # Choice entries share a fixed schema, so they are buffered per
+            # column instead of as one dict per row.
+            for column in CHOICE_RECORD_COLUMNS:
+                self.choice_records[column].append(df_entry[column])
         elif record_type == "rank":
             self.rank_records.append(df_entry)
 
     def output_records_to_df(self, record_type: str):
         if record_type == "choice":
-            df = pd.DataFrame(self.choice_records).reset_index(drop=True)
+            df = pd.DataFrame(self.choice_records)
             return df.drop_duplicates(keep="last")
         elif record_type == "rank":
             df = pd.DataFrame(self.rank_records).reset_index(drop=True)
@@ -1,5 +1,6 @@
 """Utility script to manipulate DataFrames"""
 
+from functools import lru_cache
 from typing import Iterable, List, Sequence
 
 import pandas as pd
@@ -26,7 +27,8 @@ def create_line_through_points(
     Returns:
         pd.DataFrame: A dataframe with an index as year and one value column.
     """
-    logger.info(f"Creating line through points {year_value_dict}")
+    # %-style args keep the dict unformatted unless the record is emitted
+    logger.info("Creating line through points %s", year_value_dict)
     # Creates a pairing for all elements based on location
     def create_value_pairings(iterable: list) -> list:
         value_pairings = []
@@ -45,8 +47,9 @@ def create_line_through_points(
     value_pairs = create_value_pairings(values)
     values_array = np.array(values)
 
-    # Create dataframes for every pairing
-    df_list = []
+    # Create year and value arrays for every pairing
+    year_arrays = []
+    value_arrays = []
     for year_pair, value_pair in zip(year_pairs, value_pairs):
         year_range = range(year_pair[0], year_pair[1] + 1)
         start_value = value_pair[0]
@@ -55,10 +58,15 @@ def create_line_through_points(
             values_array = np.linspace(
                 start=start_value, stop=end_value, num=len(year_range)
             )
-        df = pd.DataFrame(data={"year": year_range, "values": values_array})
-        df_list.append(df)
-    # Combine pair DataFrames into one DataFrame
-    combined_df = pd.concat(df_list)
+        year_arrays.append(np.arange(year_pair[0], year_pair[1] + 1))
+        value_arrays.append(values_array)
+    # Combine the pair arrays into one DataFrame
+    combined_df = pd.DataFrame(
+        data={
+            "year": np.concatenate(year_arrays),
+            "values": np.concatenate(value_arrays),
+        }
+    )
     return combined_df.set_index("year")
 
 
@@ -73,8 +81,11 @@ def move_cols_to_front(df: pd.DataFrame, cols_at_front: list[str]) -> list:
     Returns:
         list: A list of reordered column names.
     """
-    non_abatement_columns = list(set(df.columns).difference(set(cols_at_front)))
-    return cols_at_front + non_abatement_columns
+    # preserve the DataFrame's own ordering for the remaining columns
+    # rather than the arbitrary ordering a set difference would produce
+    front_cols = set(cols_at_front)
+    non_abatement_columns = [col for col in df.columns if col not in front_cols]
+    return list(cols_at_front) + non_abatement_columns
 
 
 def expand_dataset_year_pairs(
@@ -93,9 +104,11 @@ def expand_dataset_year_pairs(
     for year_pair in year_pairs:
         start_year, end_year = year_pair
         year_range = range(start_year + 1, end_year + 1)
-        interval = (df_c[end_year] - df_c[start_year]) / len(year_range)
-        for year in year_range:
-            df_c[year] = df_c[year - 1] + interval
+        start_values = df_c[start_year].to_numpy()
+        interval = (df_c[end_year].to_numpy() - start_values) / len(year_range)
+        steps = np.arange(1, len(year_range) + 1)
+        # one broadcast fills every interpolated year column at once
+        df_c[list(year_range)] = start_values[:, None] + interval[:, None] * steps
     return df_c
 
 
@@ -113,11 +126,13 @@ def column_sorter(
         pd.DataFrame: A DataFrame with values sorted according to col_to_sort, ordered by 'col_order'
     """
 
+    correspondence = {val: order for order, val in enumerate(col_order)}
+
     def sorter(column):
-        correspondence = {val: order for order, val in enumerate(col_order)}
         return column.map(correspondence)
 
-    return df.copy().sort_values(by=col_to_sort, key=sorter)
+    # sort_values already returns a new frame, so no up-front copy is needed
+    return df.sort_values(by=col_to_sort, key=sorter)
 
 
 def add_scenarios(
@@ -125,6 +140,7 @@ def add_scenarios(
     scenario_dict: dict,
     single_line: bool = False,
     scenario_name: bool = True,
+    copy: bool = True,
 ) -> pd.DataFrame:
     """Adds scenario metadata column(s) with metadata to each row in a DataFrame.
 
@@ -132,43 +148,65 @@ def add_scenarios(
         df (pd.DataFrame): The DataFrame you want to modify.
         scenario_dict (dict): A metadata dictionary with scenario information.
         single_line (bool, optional): A boolean flag to flatten the scenario dictionary into one line or one column for each dictionart item. Defaults to False.
+        copy (bool, optional): Determines whether to copy the DataFrame before adding columns. Callers that already own a fresh copy can pass False. Defaults to True.
 
     Returns:
         pd.DataFrame: A DataFrame with additional scenario metadata column(s).
     """
-    df_c = df.copy()
+    df_c = df.copy() if copy else df
     if scenario_name:
         df_c["scenario"] = scenario_dict["scenario_name"]
     if single_line:
         df_c["scenarios"] = str(scenario_dict)
     else:
-        for key in scenario_dict:
-            df_c[f"scenario_{key}"] = scenario_dict[key]
+        # one multi-column assignment instead of a setitem per scenario key
+        new_cols = {f"scenario_{key}": value for key, value in scenario_dict.items()}
+        df_c[list(new_cols)] = pd.DataFrame(new_cols, index=df_c.index)
     return df_c
 
 
 def add_regions(
-    df: pd.DataFrame, country_ref: dict, region_schema: str
+    df: pd.DataFrame, country_mapper: dict, region_schema: str, copy: bool = True
 ) -> pd.DataFrame:
     """Adds regional metadata column(s) to each row in a DataFrame.
 
     Args:
         df (pd.DataFrame): The DataFrame you want to modify.
         country_mapper (dict): A dictionary containing the mapping of country codes to regions.
-        country_ref_col (str): The column containing the country codes you want to map.
         region_schema (str): The name of the schema you want to map.
+        copy (bool, optional): Determines whether to copy the DataFrame before adding columns. Callers that already own a fresh copy can pass False. Defaults to True.
 
     Returns:
         pd.DataFrame: A DataFrame with additional regional metadata column(s).
     """
-    df_c = df.copy()
-    country_mapper = create_country_mapper(country_ref, region_schema)
-    df_c[f"region_{region_schema}"] = df_c["country_code"].apply(
-        lambda country: country_mapper[country]
-    )
+    df_c = df.copy() if copy else df
+    df_c[f"region_{region_schema}"] = df_c["country_code"].map(country_mapper)
     return df_c
 
 
+@lru_cache(maxsize=1)
+def load_country_ref() -> pd.DataFrame:
+    """Loads the static country reference data, cached for the lifetime of the process.
+
+    Returns:
+        pd.DataFrame: The country reference DataFrame.
+    """
+    return read_pickle_folder(PKL_DATA_IMPORTS, "country_ref", "df")
+
+
+@lru_cache(maxsize=None)
+def load_country_mapper(region_schema: str) -> dict:
+    """Builds the country code to region mapper for a schema, cached per schema.
+
+    Args:
+        region_schema (str): The name of the schema you want to map.
+
+    Returns:
+        dict: A dictionary containing the mapping of country codes to regions.
+    """
+    return create_country_mapper(load_country_ref(), region_schema)
+
+
 def add_results_metadata(
     df: pd.DataFrame,
     scenario_dict: dict,
@@ -187,12 +225,11 @@ def add_results_metadata(
     Returns:
         pd.DataFrame: The name of the schema you want to map.
     """
-    country_ref = read_pickle_folder(PKL_DATA_IMPORTS, "country_ref", "df")
-    df_c = df.copy()
-    df_c = add_scenarios(df_c, scenario_dict, single_line, scenario_name)
+    # one copy up front; the helpers then add columns to it in place
+    df_c = add_scenarios(df.copy(), scenario_dict, single_line, scenario_name, copy=False)
     if include_regions:
         for schema in RESULTS_REGIONS_TO_MAP:
-            df_c = add_regions(df_c, country_ref, schema)
+            df_c = add_regions(df_c, load_country_mapper(schema), schema, copy=False)
     return df_c
 
 
@@ -206,11 +243,13 @@ def return_furnace_group(furnace_dict: MYPY_DICT_STR_LIST, tech: str) -> List[st
     Returns:
         list: The Furnace Group of the technology
     """
-    return_value: list = []
-    for key, value_list in furnace_dict.items():
-        if tech in furnace_dict[key]:
-            return_value = value_list
-    return return_value
+    # a tech can belong to several groups; the last-declared group wins
+    # (the aggregate groups are declared last), so scan in reverse and
+    # return at the first hit instead of walking the whole mapping
+    for value_list in reversed(list(furnace_dict.values())):
+        if tech in value_list:
+            return value_list
+    return []
 
 
 def melt_and_index(
@@ -228,9 +267,21 @@ def melt_and_index(
     Returns:
         pd.DataFrame: The melted / tabular Dataframe.
     """
-    df_c = df.copy()
-    df_c = pd.melt(frame=df_c, id_vars=id_vars, var_name=var_name)
-    return df_c.set_index(index)
+    # stack() reshapes the existing blocks directly instead of materializing
+    # a long-form intermediate the way melt does; dropna=False keeps NaN
+    # value rows, matching what melt produced.
+    df_c = (
+        df.set_index(id_vars)
+        .rename_axis(columns=var_name)
+        .stack(dropna=False)
+        .rename("value")
+        .to_frame()
+    )
+    if list(df_c.index.names) != list(index):
+        df_c = df_c.reset_index().set_index(index)
+    # a lexsorted MultiIndex keeps subsequent .loc lookups on the C-level
+    # searchsorted path instead of a per-level linear scan
+    return df_c.sort_index()
 
 
 def expand_melt_and_sort_years(
@@ -246,11 +297,12 @@ def expand_melt_and_sort_years(
     Returns:
         pd.DataFrame: The modified DataFrame.
     """
-    df_c = df.copy()
-    df_c = expand_dataset_year_pairs(df_c, year_pairs)
-    years = [year_col for year_col in df_c.columns if isinstance(year_col, int)]
-    df_c = df_c.melt(id_vars=set(df_c.columns).difference(set(years)), var_name="year")
-    return df_c.sort_values(by=["year"], axis=0)
+    # expand_dataset_year_pairs copies the frame, so no up-front copy is needed
+    df_c = expand_dataset_year_pairs(df, year_pairs)
+    id_vars = [col for col in df_c.columns if not isinstance(col, int)]
+    df_c = df_c.melt(id_vars=id_vars, var_name="year")
+    # a stable sort keeps the melted rows in a deterministic order per year
+    return df_c.sort_values(by=["year"], axis=0, kind="mergesort")
 
 
 def convert_currency_col(
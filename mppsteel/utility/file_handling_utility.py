@@ -3,11 +3,14 @@
 import os
 import pickle
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 from typing import Dict, Sequence, Union
 
 import pandas as pd
+from pyarrow import feather
+
 from mppsteel.config.model_config import (
     COMBINED_OUTPUT_FOLDER_NAME,
     FINAL_DATA_OUTPUT_NAME,
@@ -51,8 +54,7 @@ def read_pickle_folder(
     if mode == "df":
         if log:
             logger.info(f"||| Loading pickle file {pkl_file} from path {data_path}")
-        with open(rf"{data_path}/{pkl_file}.pickle", "rb") as f:
-            df: pd.DataFrame = pickle.load(f)
+        df: pd.DataFrame = _deserialize_file(data_path, pkl_file)
 
     elif mode == "dict":
         if log:
@@ -61,12 +63,30 @@ def read_pickle_folder(
         for pkl_file in os.listdir(data_path):
             if log:
                 logger.info(f"|||| Loading {pkl_file}")
-            with open(rf"{data_path}/{pkl_file}", "rb") as f:
-                new_data_dict[pkl_file.split(".")[0]] = pickle.load(f)
+            new_data_dict[pkl_file.split(".")[0]] = _deserialize_file(
+                data_path, pkl_file.split(".")[0]
+            )
         data_dict: dict = new_data_dict
     return df if mode == "df" else data_dict
 
 
+def _deserialize_file(data_path: Union[str, Path], filename: str):
+    """Loads a serialized object, preferring the feather copy when one exists.
+
+    Args:
+        data_path (Union[str, Path]): The folder where the serialized file is stored.
+        filename (str): The name of the file to load (without extension).
+
+    Returns:
+        The deserialized object.
+    """
+    feather_path = Path(rf"{data_path}/{filename}.feather")
+    if feather_path.is_file():
+        return feather.read_feather(feather_path, memory_map=True)
+    with open(rf"{data_path}/{filename}.pickle", "rb") as f:
+        return pickle.load(f)
+
+
 def extract_data(
     data_path: str, filename: str, ext: str, sheet: int = 0
 ) -> pd.DataFrame:
@@ -91,19 +111,39 @@ def extract_data(
         return pd.read_csv(full_filename)
 
 
+def _feather_compatible(df: pd.DataFrame) -> bool:
+    """Feather stores require a default RangeIndex and string column names."""
+    return (
+        isinstance(df.index, pd.RangeIndex)
+        and df.index.equals(pd.RangeIndex(len(df)))
+        and all(isinstance(col, str) for col in df.columns)
+    )
+
+
 def serialize_file(obj, pkl_folder: str, filename: str) -> None:
-    """Serializes a file using the pickle protocol.
+    """Serializes a file to the columnar feather format (DataFrames with a
+    default index) or using the pickle protocol (everything else).
 
     Args:
         obj: The object that you want to serialize.
         pkl_folder (str): The folder where you want to store the pickle file.
         filename (str): The name of the file you want to use (do not include a file extension in the string)
     """
-    filename = f"{pkl_folder}/{filename}.pickle"
-    with open(filename, "wb") as f:
-        # Pickle the 'data' using the highest protocol available.
-        logger.info(f"* Saving Pickle file {filename} to path")
-        pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+    feather_path = Path(f"{pkl_folder}/{filename}.feather")
+    pickle_path = Path(f"{pkl_folder}/{filename}.pickle")
+    if isinstance(obj, pd.DataFrame) and _feather_compatible(obj):
+        logger.info(f"* Saving feather file {feather_path} to path")
+        feather.write_feather(obj, feather_path)
+        stale_path = pickle_path
+    else:
+        with open(pickle_path, "wb") as f:
+            # Pickle the 'data' using the highest protocol available.
+            logger.info(f"* Saving Pickle file {pickle_path} to path")
+            pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+        stale_path = feather_path
+    # remove any leftover copy in the other format so reads cannot go stale
+    if stale_path.is_file():
+        stale_path.unlink()
 
 
 def serialize_df_dict(data_path: str, data_dict: dict) -> None:
@@ -114,8 +154,14 @@ def serialize_df_dict(data_path: str, data_dict: dict) -> None:
         data_path (str): The path where the pickle files will be stored
     """
     logger.info(f"||| Serializing each df to a pickle file {data_path}")
-    for df_name in data_dict:
-        serialize_file(data_dict[df_name], data_path, df_name)
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(serialize_file, data_dict[df_name], data_path, df_name)
+            for df_name in data_dict
+        ]
+    # surface any worker exception instead of silently swallowing it
+    for future in futures:
+        future.result()
 
 
 def create_folders_if_nonexistant(folder_list: list) -> None:
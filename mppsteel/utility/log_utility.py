@@ -27,22 +27,31 @@ def get_console_handler() -> logging.StreamHandler:
     return console_handler
 
 
+_FILE_HANDLER = None
+
+
 def get_file_handler() -> TimedRotatingFileHandler:
     """Formats the log for file output.
 
+    The handler is created once and shared so that every logger writes to the
+    same logfile through a single file descriptor.
+
     Returns:
         [type]: A formatted file handler.
     """
-    today_time = datetime.now().strftime(DATETIME_FORMAT)
-    if not Path(LOG_PATH).is_dir():
-        try:
-            os.mkdir(LOG_PATH)
-        except OSError as error:
-            print(error)
-    log_filepath = f"{LOG_PATH}/mppsteel_{today_time}.log"
-    file_handler = TimedRotatingFileHandler(log_filepath, when="midnight")
-    file_handler.setFormatter(LOG_FORMATTER)
-    return file_handler
+    global _FILE_HANDLER
+    if _FILE_HANDLER is None:
+        today_time = datetime.now().strftime(DATETIME_FORMAT)
+        if not Path(LOG_PATH).is_dir():
+            try:
+                os.mkdir(LOG_PATH)
+            except OSError as error:
+                print(error)
+        log_filepath = f"{LOG_PATH}/mppsteel_{today_time}.log"
+        file_handler = TimedRotatingFileHandler(log_filepath, when="midnight")
+        file_handler.setFormatter(LOG_FORMATTER)
+        _FILE_HANDLER = file_handler
+    return _FILE_HANDLER
 
 
 def get_logger(logger_name: str, create_logfile: bool = True) -> logging.Logger:
@@ -59,9 +68,10 @@ def get_logger(logger_name: str, create_logfile: bool = True) -> logging.Logger:
     generic_logger.setLevel(
         logging.DEBUG
     )  # better to have too much log than not enough
-    generic_logger.addHandler(get_console_handler())
-    if create_logfile:
-        generic_logger.addHandler(get_file_handler())
+    if not generic_logger.handlers:  # avoid duplicate handlers on repeat calls
+        generic_logger.addHandler(get_console_handler())
+        if create_logfile:
+            generic_logger.addHandler(get_file_handler())
     generic_logger.propagate = (
         False  # rarely necessary to propagate the error up to parent
     )